@@ -40,7 +40,8 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "seo-automation=seo_automation.cli:main",
+            "seo-automation=src.seo_automation.cli:main",
+            "seo-auto-optimizer=src.seo_automation.auto_optimizer.cli:main",
         ],
     },
     include_package_data=True,
@@ -1,13 +1,41 @@
 """SEO自动化工具包"""
 
+from ._loader import load as _load
+
 __version__ = "0.1.0"
 
-from .crawler import WebCrawler, ConcurrentWebCrawler, get_crawler
-from .keyword_analyzer import KeywordAnalyzer, get_keyword_analyzer
-from .seo_scorer import SEOScorer, get_seo_scorer
-from .report_generator import ReportGenerator, get_report_generator
-from .performance_analyzer import PerformanceAnalyzer, get_performance_analyzer
-from . import cli
+# 公开名称 -> (子模块, 属性名)；属性名为None表示导出子模块本身。
+# 子模块在首次访问时才导入（PEP 562），只读取__version__时不会加载nltk等重量级依赖。
+_LAZY_IMPORTS = {
+    "WebCrawler": (".crawler", "WebCrawler"),
+    "ConcurrentWebCrawler": (".crawler", "ConcurrentWebCrawler"),
+    "get_crawler": (".crawler", "get_crawler"),
+    "KeywordAnalyzer": (".keyword_analyzer", "KeywordAnalyzer"),
+    "get_keyword_analyzer": (".keyword_analyzer", "get_keyword_analyzer"),
+    "SEOScorer": (".seo_scorer", "SEOScorer"),
+    "get_seo_scorer": (".seo_scorer", "get_seo_scorer"),
+    "ReportGenerator": (".report_generator", "ReportGenerator"),
+    "get_report_generator": (".report_generator", "get_report_generator"),
+    "PerformanceAnalyzer": (".performance_analyzer", "PerformanceAnalyzer"),
+    "get_performance_analyzer": (".performance_analyzer", "get_performance_analyzer"),
+    "cli": (".cli", None),
+}
+
+
+def __getattr__(name):
+    """按需导入公开的类和函数"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = _load(__name__ + module_name, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "WebCrawler",
@@ -22,4 +50,4 @@ __all__ = [
     "PerformanceAnalyzer",
     "get_performance_analyzer",
     "cli"
-]
\ No newline at end of file
+]
@@ -0,0 +1,23 @@
+"""按需导入模块属性的辅助函数"""
+
+import functools
+import importlib
+from typing import Any, Optional
+
+
+@functools.lru_cache(maxsize=None)
+def load(module_name: str, attr: Optional[str] = None) -> Any:
+    """
+    导入模块并返回其属性，结果按 (模块名, 属性名) 缓存
+
+    重复调用时直接返回缓存对象，不再进入导入系统。
+
+    Args:
+        module_name: 模块的完整名称，如 'src.seo_automation.crawler'
+        attr: 属性名称，为None时返回模块本身
+
+    Returns:
+        Any: 模块或模块属性
+    """
+    module = importlib.import_module(module_name)
+    return module if attr is None else getattr(module, attr)
@@ -1,12 +1,33 @@
 """SEO自优化模块"""
 
-from .optimizer import SEOAutoOptimizer
-from .config_manager import ConfigManager
-from .analyzer import SEOAnalyzer
-from .suggestion_generator import SuggestionGenerator
-from .optimizer_executor import OptimizerExecutor
-from .backup_manager import BackupManager
-from .report_generator import ReportGenerator
+from .._loader import load as _load
+
+# 公开名称 -> (子模块, 属性名)，首次访问时才导入对应子模块（PEP 562）
+_LAZY_IMPORTS = {
+    'SEOAutoOptimizer': ('.optimizer', 'SEOAutoOptimizer'),
+    'ConfigManager': ('.config_manager', 'ConfigManager'),
+    'SEOAnalyzer': ('.analyzer', 'SEOAnalyzer'),
+    'SuggestionGenerator': ('.suggestion_generator', 'SuggestionGenerator'),
+    'OptimizerExecutor': ('.optimizer_executor', 'OptimizerExecutor'),
+    'BackupManager': ('.backup_manager', 'BackupManager'),
+    'ReportGenerator': ('.report_generator', 'ReportGenerator'),
+}
+
+
+def __getattr__(name):
+    """按需导入公开的类"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = _load(__name__ + module_name, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     'SEOAutoOptimizer',
@@ -16,4 +37,4 @@ __all__ = [
     'OptimizerExecutor',
     'BackupManager',
     'ReportGenerator'
-]
\ No newline at end of file
+]
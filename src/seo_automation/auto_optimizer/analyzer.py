@@ -1,23 +1,164 @@
 """SEO分析器，基于现有SEO_Optimizer工具实现网站分析功能"""
 
 import os
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 
-from src.seo_automation.crawler import WebCrawler
-from src.seo_automation.keyword_analyzer import KeywordAnalyzer, get_keyword_analyzer
-from src.seo_automation.seo_scorer import SEOScorer
-from src.seo_automation.performance_analyzer import PerformanceAnalyzer
+from src.seo_automation._loader import load
 
 from .config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# HTML文件数量达到该阈值时才启用多进程解析，文件较少时进程启动开销得不偿失
+PARALLEL_PARSE_MIN_FILES = 8
+
+# 文本预处理结果缓存的最大条目数，超出后按最近最少使用淘汰
+PREPROCESS_CACHE_MAX_ENTRIES = 1024
+
+
+class Image(namedtuple('Image', 'src alt title')):
+    """页面图片记录，比逐个元素构建字典更省内存"""
+    __slots__ = ()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        兼容字典式访问，供SEOScorer按img.get('alt', '')读取，只暴露记录字段
+        
+        SEOScorer同时处理爬虫生成的字典记录，因此保留该方法而不改为属性访问。
+        """
+        return getattr(self, key) if key in self._fields else default
+
+
+class Link(namedtuple('Link', 'href text title')):
+    """页面链接记录，比逐个元素构建字典更省内存"""
+    __slots__ = ()
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        兼容字典式访问，供SEOScorer按link.get('href', '')读取，只暴露记录字段
+        
+        SEOScorer同时处理爬虫生成的字典记录，因此保留该方法而不改为属性访问。
+        """
+        return getattr(self, key) if key in self._fields else default
+
+
+def _serialize_page_data(page_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将页面数据中的图片和链接记录转换为字典，用于对外返回和JSON序列化
+    
+    Args:
+        page_data: 页面数据
+        
+    Returns:
+        Dict: 图片和链接均为字典列表的页面数据
+    """
+    if 'images' not in page_data:
+        return page_data
+    serialized = dict(page_data)
+    serialized['images'] = [img._asdict() for img in page_data['images']]
+    serialized['links'] = [link._asdict() for link in page_data['links']]
+    return serialized
+
+
+def _init_parse_worker():
+    """解析进程池的初始化函数，在每个工作进程启动时预先导入一次bs4"""
+    load('bs4', 'BeautifulSoup')
+
+
+def _parse_html_file(file_path: str, relative_path: str, depth: int) -> Tuple[str, Dict[str, Any]]:
+    """
+    读取并解析单个HTML文件，提取SEO分析所需的页面数据
+    
+    该函数定义在模块级别，以便在进程池中执行。
+    
+    Args:
+        file_path: HTML文件路径
+        relative_path: 相对于网站根目录的路径
+        depth: 文件所在目录相对于网站根目录的深度
+        
+    Returns:
+        Tuple: (相对路径, 页面数据)
+    """
+    try:
+        # bs4在首次解析时才导入，load()带缓存，同一进程内只导入一次
+        BeautifulSoup = load('bs4', 'BeautifulSoup')
+        
+        # 直接以字节方式交给lxml解析，由其在C层完成编码检测和解码；
+        # 使用1 MiB缓冲区，减少大页面读取时的系统调用次数
+        with open(file_path, 'rb', buffering=1 << 20) as f:
+            soup = BeautifulSoup(f, 'lxml')
+        
+        # 提取页面信息（转换为普通字符串，避免在进程间传递时带上整棵文档树）
+        title = soup.title.string if soup.title else ''
+        if title is not None:
+            title = str(title)
+        meta_description = ''
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        if meta_desc:
+            meta_description = meta_desc.get('content', '')
+        
+        # 提取文本内容
+        text_content = soup.get_text(separator=' ', strip=True)
+        
+        # 单次遍历文档树，同时提取标题标签、图片和链接
+        headings = {'h1': [], 'h2': [], 'h3': []}
+        images = []
+        links = []
+        for element in soup.find_all(['h1', 'h2', 'h3', 'img', 'a']):
+            name = element.name
+            if name in headings:
+                headings[name].append(element.text.strip())
+            elif name == 'img':
+                images.append(Image(element.get('src', ''), element.get('alt', ''), element.get('title', '')))
+            else:
+                links.append(Link(element.get('href', ''), element.text.strip(), element.get('title', '')))
+        
+        # 构建页面数据
+        page_data = {
+            'url': f"file:///{file_path.replace(os.sep, '/')}",
+            'path': relative_path,
+            'title': title,
+            'meta_description': meta_description,
+            'content': text_content,
+            'content_length': len(text_content),
+            'headings': headings,
+            'images': images,
+            'links': links,
+            'status_code': 200,  # 本地文件始终成功
+            'response_time': 0,  # 本地文件没有响应时间
+            'depth': depth  # 使用目录深度作为爬取深度
+        }
+        
+        return relative_path, page_data
+        
+    except Exception as e:
+        logger.warning(f"处理文件失败 {file_path}: {str(e)}")
+        # 记录错误页面
+        return relative_path, {
+            'url': f"file:///{file_path.replace(os.sep, '/')}",
+            'path': relative_path,
+            'error': str(e),
+            'status_code': None,
+            'depth': depth
+        }
+
 
 class SEOAnalyzer:
     """SEO分析器，集成现有SEO_Optimizer工具进行网站分析"""
     
+    # 固定实例属性，减少实例内存并加快遍历热循环中的属性访问
+    __slots__ = (
+        'config_manager', 'site_path', 'analysis_config', 'file_types', 'exclude_patterns',
+        '_ext_sets', '_html_exts', '_exclude_re', '_ext_to_cat',
+        'crawler', 'keyword_analyzer', 'seo_scorer', 'performance_analyzer',
+        'raw_pages_data', 'keyword_analysis_results', 'seo_scores', 'performance_results',
+        '_fs_stats', '_preprocess_cache'
+    )
+    
     def __init__(self, config_manager: ConfigManager):
         """
         初始化SEO分析器
@@ -56,6 +197,14 @@ class SEOAnalyzer:
         exclude_patterns = config_manager.get_config('exclude_patterns')
         self.exclude_patterns = exclude_patterns if isinstance(exclude_patterns, list) else []
         
+        # 预先计算遍历时频繁使用的不可变查找结构
+        # 扩展名集合使用frozenset，成员判断为O(1)哈希查找
+        self._ext_sets = config_manager.get_file_type_sets()[0]
+        self._html_exts = self._ext_sets.get('html', frozenset(('.html', '.htm')))
+        # 所有排除模式合并为一个正则（由配置管理器编译并缓存），每个目录只需一次C层扫描即可完成匹配
+        self._exclude_re = config_manager.get_exclude_regex()
+        self._ext_to_cat = {ext: category for category, exts in self.file_types.items() for ext in exts}
+        
         # 初始化分析工具
         self.crawler = None
         self.keyword_analyzer = None
@@ -67,6 +216,11 @@ class SEOAnalyzer:
         self.keyword_analysis_results = {}
         self.seo_scores = {}
         self.performance_results = {}
+        
+        # 爬取时顺带统计的文件系统信息（总大小和资源数量），供性能分析复用
+        self._fs_stats = None
+        # 按页面内容哈希缓存预处理结果，模板生成的重复页面无需再次分词
+        self._preprocess_cache = OrderedDict()
     
     def analyze_website(self) -> Dict[str, Any]:
         """
@@ -129,6 +283,8 @@ class SEOAnalyzer:
                 # 确保使用正确的file://格式
                 base_url = f'file:///{os.path.abspath(base_url).replace(chr(92), "/")}'
         
+        # 分析工具通过带缓存的load()获取，同一进程中多次分析不会重复进入导入系统
+        WebCrawler = load('src.seo_automation.crawler', 'WebCrawler')
         self.crawler = WebCrawler(
             base_url=base_url,
             depth=max_depth,
@@ -138,25 +294,29 @@ class SEOAnalyzer:
         
         # 初始化关键词分析器
         skip_nltk_download = self.analysis_config.get('skip_nltk_download', True)
+        get_keyword_analyzer = load('src.seo_automation.keyword_analyzer', 'get_keyword_analyzer')
         self.keyword_analyzer = get_keyword_analyzer(skip_download=skip_nltk_download)
         
         # 初始化SEO评分器
-        self.seo_scorer = SEOScorer()
+        self.seo_scorer = load('src.seo_automation.seo_scorer', 'SEOScorer')()
         
         # 初始化性能分析器
-        self.performance_analyzer = PerformanceAnalyzer()
+        self.performance_analyzer = load('src.seo_automation.performance_analyzer', 'PerformanceAnalyzer')()
     
     def _crawl_website(self):
         """爬取网站页面数据"""
-        logger.critical("CRITICAL: 开始执行网站爬取逻辑...")
         # 对于本地网站，我们需要实现一个文件系统爬虫
         # 这里先实现一个简单版本，遍历HTML文件
         
-        # 获取HTML文件类型配置
-        file_types_config = self.config_manager.get_config('file_types')
-        file_types = file_types_config.get('html', ['.html', '.htm']) if file_types_config else ['.html', '.htm']
-        # 获取排除模式配置
-        exclude_patterns = self.config_manager.get_config('exclude_patterns') or []
+        # 文件类型和排除模式在初始化时已预先计算，绑定为局部变量供遍历使用
+        html_exts = self._html_exts
+        exclude_search = self._exclude_re.search if self._exclude_re else None
+        
+        # 爬取的同时统计文件大小和资源数量，避免性能分析时再次遍历目录树
+        self._fs_stats = None
+        resource_counts = self._init_resource_counts()
+        ext_to_cat = self._ext_to_cat
+        total_size = 0
         
         # 确保site_path是字符串类型
         site_path = self.site_path
@@ -166,8 +326,8 @@ class SEOAnalyzer:
         
         logger.info(f"开始扫描文件系统，查找HTML文件...")
         logger.info(f"扫描目录: {site_path}")
-        logger.info(f"HTML文件类型: {file_types}")
-        logger.info(f"排除模式: {exclude_patterns}")
+        logger.info(f"HTML文件类型: {sorted(html_exts)}")
+        logger.info(f"排除模式: {self.exclude_patterns}")
         
         # 检查目录是否存在和可访问
         if not os.path.exists(site_path):
@@ -180,112 +340,84 @@ class SEOAnalyzer:
         # 列出目录中的文件
         try:
             files_in_dir = os.listdir(site_path)
-            logger.info(f"目录中的文件: {files_in_dir}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("目录中的文件: %s", files_in_dir)
         except Exception as e:
             logger.error(f"无法列出目录内容: {str(e)}")
             return
         
+        # 逐文件的跟踪日志只在DEBUG级别输出，避免在遍历热循环中格式化字符串
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         html_found = False
-        for root, dirs, files in os.walk(site_path):
-            logger.info(f"扫描子目录: {root}")
-            logger.info(f"找到文件数量: {len(files)}")
+        html_files = []
+        # 目录栈中同时记录相对路径前缀和深度，每个文件无需再调用relpath和count计算
+        pending_dirs = [(site_path, '', 0)]
+        while pending_dirs:
+            root, rel_prefix, dir_depth = pending_dirs.pop()
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning(f"无法读取目录 {root}: {str(e)}")
+                continue
+            
+            files = [entry for entry in entries if entry.is_file()]
+            if debug_enabled:
+                logger.debug("扫描子目录: %s", root)
+                logger.debug("找到文件数量: %d", len(files))
             
             # 过滤排除的目录
-            dirs[:] = [d for d in dirs if not any(pattern in os.path.join(root, d) for pattern in exclude_patterns)]
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not (exclude_search and exclude_search(entry.path)):
+                    pending_dirs.append((entry.path, rel_prefix + entry.name + os.sep, dir_depth + 1))
             
-            for file in files:
-                logger.info(f"检查文件: {file}")
+            for entry in files:
+                file = entry.name
+                stem, dot, ext = file.rpartition('.')
+                
+                # 统计文件大小和资源类别
+                try:
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError as e:
+                    logger.warning(f"分析文件大小失败 {entry.path}: {str(e)}")
+                else:
+                    resource_counts[ext_to_cat.get(f".{ext.lower()}" if stem else '', 'other')] += 1
+                
+                if debug_enabled:
+                    logger.debug("检查文件: %s", file)
                 # 检查文件类型
-                if any(file.endswith(ext) for ext in file_types):
-                    logger.info(f"找到HTML文件: {file}")
+                if dot and f".{ext}" in html_exts:
+                    if debug_enabled:
+                        logger.debug("找到HTML文件: %s", file)
                     html_found = True
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, site_path)
-                    
-                    try:
-                        # 读取文件内容
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        
-                        # 解析HTML
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 提取页面信息
-                        title = soup.title.string if soup.title else ''
-                        meta_description = ''
-                        meta_desc = soup.find('meta', attrs={'name': 'description'})
-                        if meta_desc:
-                            meta_description = meta_desc.get('content', '')
-                        
-                        # 提取文本内容
-                        text_content = soup.get_text(separator=' ', strip=True)
-                        
-                        # 提取标题标签
-                        headings = {'h1': [], 'h2': [], 'h3': []}
-                        for level in headings.keys():
-                            for heading in soup.find_all(level):
-                                headings[level].append(heading.text.strip())
-                        
-                        # 提取图片
-                        images = []
-                        for img in soup.find_all('img'):
-                            img_info = {
-                                'src': img.get('src', ''),
-                                'alt': img.get('alt', ''),
-                                'title': img.get('title', '')
-                            }
-                            images.append(img_info)
-                        
-                        # 提取链接
-                        links = []
-                        for link in soup.find_all('a'):
-                            link_info = {
-                                'href': link.get('href', ''),
-                                'text': link.text.strip(),
-                                'title': link.get('title', '')
-                            }
-                            links.append(link_info)
-                        
-                        # 构建页面数据
-                        page_data = {
-                            'url': f"file:///{file_path.replace(os.sep, '/')}",
-                            'path': relative_path,
-                            'title': title,
-                            'meta_description': meta_description,
-                            'content': text_content,
-                            'content_length': len(text_content),
-                            'headings': headings,
-                            'images': images,
-                            'links': links,
-                            'status_code': 200,  # 本地文件始终成功
-                            'response_time': 0,  # 本地文件没有响应时间
-                            'depth': relative_path.count(os.sep)  # 使用目录深度作为爬取深度
-                        }
-                        
-                        self.raw_pages_data[relative_path] = page_data
-                        
-                    except Exception as e:
-                        logger.warning(f"处理文件失败 {file_path}: {str(e)}")
-                        # 记录错误页面
-                        self.raw_pages_data[relative_path] = {
-                            'url': f"file:///{file_path.replace(os.sep, '/')}",
-                            'path': relative_path,
-                            'error': str(e),
-                            'status_code': None,
-                            'depth': relative_path.count(os.sep)
-                        }
+                    html_files.append((entry.path, rel_prefix + file, dir_depth))
+        
+        self._fs_stats = {'total_size': total_size, 'resource_counts': resource_counts}
+        
+        # 解析HTML文件：文件较多时使用多进程并行解析，否则顺序解析
+        file_paths = [item[0] for item in html_files]
+        relative_paths = [item[1] for item in html_files]
+        depths = [item[2] for item in html_files]
+        parsed_pages = None
+        if len(html_files) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=self.analysis_config.get('max_workers'),
+                                         initializer=_init_parse_worker) as executor:
+                    parsed_pages = list(executor.map(_parse_html_file, file_paths, relative_paths, depths, chunksize=16))
+            except Exception as e:
+                logger.warning(f"并行解析HTML文件失败，改为顺序解析: {str(e)}")
+                parsed_pages = None
+        if parsed_pages is None:
+            parsed_pages = map(_parse_html_file, file_paths, relative_paths, depths)
+        
+        for relative_path, page_data in parsed_pages:
+            self.raw_pages_data[relative_path] = page_data
         
         logger.info(f"扫描完成，共发现 {len(self.raw_pages_data)} 个HTML文件")
     
     def _analyze_keywords(self):
         """分析页面关键词"""
         page_analyses = {}
-        all_content = []
-        
-        # 收集所有内容用于整体分析
-        for path, page_data in self.raw_pages_data.items():
-            if 'error' not in page_data and 'content' in page_data:
-                all_content.append(page_data['content'])
         
         # 对每个页面进行关键词分析
         for path, page_data in self.raw_pages_data.items():
@@ -303,33 +435,31 @@ class SEOAnalyzer:
                 # 这里简化处理，实际应该从配置或网站内容中提取关键词
                 
                 # 预处理文本
-                processed_text = self.keyword_analyzer._preprocess_text(text_content)
+                processed_text = self._preprocess_text_cached(text_content)
                 
                 # 简单的关键词分析
                 keyword_density = {}
                 if processed_text:
-                    # 统计词频
-                    word_freq = {}
-                    for word in processed_text:
-                        if len(word) > 2:  # 忽略太短的词
-                            word_freq[word] = word_freq.get(word, 0) + 1
+                    # 统计词频（忽略太短的词）
+                    word_freq = Counter(word for word in processed_text if len(word) > 2)
                     
                     # 提取前10个高频词作为关键词
                     total_words = len(processed_text)
-                    if total_words > 0:
-                        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-                        for word, count in sorted_words:
-                            keyword_density[word] = (count / total_words) * 100
+                    for word, count in word_freq.most_common(10):
+                        keyword_density[word] = (count / total_words) * 100
                 
                 # 分析标题中的关键词
                 title_keyword_analysis = {}
                 if title:
                     title_lower = title.lower()
-                    for keyword in keyword_density.keys():
-                        if keyword in title_lower:
+                    early_threshold = len(title_lower) * 0.3
+                    for keyword in keyword_density:
+                        # 单次find同时判断是否存在及出现位置
+                        idx = title_lower.find(keyword)
+                        if idx >= 0:
                             title_keyword_analysis[keyword] = {
                                 'present': True,
-                                'early_in_title': title_lower.index(keyword) < len(title_lower) * 0.3
+                                'early_in_title': idx < early_threshold
                             }
                         else:
                             title_keyword_analysis[keyword] = {'present': False}
@@ -363,52 +493,40 @@ class SEOAnalyzer:
             self.keyword_analysis_results
         )
     
+    def _preprocess_text_cached(self, text_content: str) -> List[str]:
+        """
+        带缓存的文本预处理，内容相同的页面复用已有的分词结果
+        
+        Args:
+            text_content: 页面文本内容
+            
+        Returns:
+            List: 预处理后的词列表
+        """
+        key = hashlib.blake2b(text_content.encode('utf-8'), digest_size=16).digest()
+        cache = self._preprocess_cache
+        processed_text = cache.get(key)
+        if processed_text is not None:
+            cache.move_to_end(key)
+            return processed_text
+        
+        processed_text = self.keyword_analyzer._preprocess_text(text_content)
+        cache[key] = processed_text
+        if len(cache) > PREPROCESS_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return processed_text
+    
     def _analyze_performance(self):
         """进行性能分析"""
         # 对于本地文件，性能分析相对简单
         # 主要分析文件大小和资源数量
         
-        total_size = 0
-        resource_counts = {
-            'html': 0,
-            'css': 0,
-            'js': 0,
-            'images': 0,
-            'other': 0
-        }
-        
-        # 分析文件大小
-        file_types = self.config_manager.get_config('file_types') or {}
-        
-        for root, dirs, files in os.walk(self.site_path):
-            # 过滤排除的目录
-            exclude_patterns = self.config_manager.get_config('exclude_patterns') or []
-            dirs[:] = [d for d in dirs if not any(pattern in os.path.join(root, d) for pattern in exclude_patterns)]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                try:
-                    # 获取文件大小
-                    file_size = os.path.getsize(file_path)
-                    total_size += file_size
-                    
-                    # 分类统计
-                    file_ext = os.path.splitext(file)[1].lower()
-                    
-                    if file_ext in file_types.get('html', []):
-                        resource_counts['html'] += 1
-                    elif file_ext in file_types.get('css', []):
-                        resource_counts['css'] += 1
-                    elif file_ext in file_types.get('js', []):
-                        resource_counts['js'] += 1
-                    elif file_ext in file_types.get('images', []):
-                        resource_counts['images'] += 1
-                    else:
-                        resource_counts['other'] += 1
-                        
-                except Exception as e:
-                    logger.warning(f"分析文件大小失败 {file_path}: {str(e)}")
+        if self._fs_stats is not None:
+            # 爬取阶段已经统计过，直接复用
+            total_size = self._fs_stats['total_size']
+            resource_counts = self._fs_stats['resource_counts']
+        else:
+            total_size, resource_counts = self._scan_resources()
         
         # 构建性能分析结果
         self.performance_results = {
@@ -420,6 +538,72 @@ class SEOAnalyzer:
             'optimization_suggestions': self._generate_performance_suggestions(total_size, resource_counts)
         }
     
+    def _init_resource_counts(self) -> Dict[str, int]:
+        """
+        初始化资源计数，包含所有配置的资源类别及'other'
+        
+        Returns:
+            Dict: 资源计数字典
+        """
+        resource_counts = {
+            'html': 0,
+            'css': 0,
+            'js': 0,
+            'images': 0,
+            'other': 0
+        }
+        for category in self.file_types:
+            resource_counts.setdefault(category, 0)
+        return resource_counts
+    
+    def _scan_resources(self) -> Tuple[int, Dict[str, int]]:
+        """
+        遍历网站目录，统计文件总大小和各类资源数量
+        
+        仅在爬取阶段未统计文件系统信息时使用。
+        
+        Returns:
+            Tuple: (文件总大小, 资源计数字典)
+        """
+        total_size = 0
+        
+        # 分析文件大小（使用初始化时预先计算的查找结构）
+        exclude_search = self._exclude_re.search if self._exclude_re else None
+        ext_to_cat = self._ext_to_cat
+        resource_counts = self._init_resource_counts()
+        
+        # 使用os.scandir迭代遍历，复用DirEntry缓存的类型和大小信息
+        pending_dirs = [self.site_path]
+        while pending_dirs:
+            root = pending_dirs.pop()
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # 过滤排除的目录
+                                if not (exclude_search and exclude_search(entry.path)):
+                                    pending_dirs.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            
+                            # 获取文件大小
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            
+                            # 分类统计
+                            stem, dot, ext = entry.name.rpartition('.')
+                            file_ext = f".{ext.lower()}" if stem else ''
+                            
+                            resource_counts[ext_to_cat.get(file_ext, 'other')] += 1
+                                
+                        except OSError as e:
+                            logger.warning(f"分析文件大小失败 {entry.path}: {str(e)}")
+            except OSError as e:
+                logger.warning(f"无法读取目录 {root}: {str(e)}")
+        
+        return total_size, resource_counts
+    
     def _calculate_performance_score(self, total_size: int, resource_counts: Dict[str, int]) -> float:
         """计算性能得分"""
         # 简单的性能评分算法
@@ -478,7 +662,8 @@ class SEOAnalyzer:
     def _compile_results(self) -> Dict[str, Any]:
         """汇总所有分析结果"""
         return {
-            'raw_pages_data': self.raw_pages_data,
+            # 结果会被序列化为JSON，图片和链接记录在此处转换为字典
+            'raw_pages_data': {path: _serialize_page_data(page_data) for path, page_data in self.raw_pages_data.items()},
             'keyword_analysis': self.keyword_analysis_results,
             'seo_scores': self.seo_scores,
             'performance_analysis': self.performance_results,
@@ -509,7 +694,7 @@ class SEOAnalyzer:
             return None
         
         return {
-            'page_data': page_data,
+            'page_data': _serialize_page_data(page_data),
             'keyword_analysis': keyword_analysis,
             'seo_score': seo_score
         }
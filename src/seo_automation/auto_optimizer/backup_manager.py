@@ -1,18 +1,444 @@
-"""备份和恢复管理器，用于在优化前备份网站文件并支持恢复操作"""
+"""
+备份和恢复管理器，用于在优化前备份网站文件并支持恢复操作
 
+并行压缩、内容去重和增量复用需要直接写入预压缩的ZIP条目，依赖zipfile的部分内部接口
+（_get_compressor、ZipFile._writecheck/_lock、本地文件头结构常量）。导入时先做一次功能探测，
+不可用时退回ZipFile.write逐个压缩写入。并行恢复时各线程直接构造zipfile.ZipExtFile读取条目，
+同样先做功能探测，不可用时退回ZipFile.open。已在CPython 3.8–3.13上测试。
+"""
+
+import io
 import os
+import re
+import fnmatch
 import shutil
 import logging
 import datetime
 import zipfile
+import zlib
 import json
-from typing import Dict, List, Optional, Any
+import mmap
+import struct
+import threading
+import functools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Callable, Tuple, Iterator
 import hashlib
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# 默认的备份完整性校验算法，未安装blake3时依次回退到xxh3和标准库blake2b
+DEFAULT_HASH_ALGO = 'blake3'
+
+# 备份压缩方式，Python 3.14+ 的zipfile支持zstd
+COMPRESSION_METHODS = {
+    'stored': zipfile.ZIP_STORED,
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+}
+if hasattr(zipfile, 'ZIP_ZSTANDARD'):
+    COMPRESSION_METHODS['zstd'] = zipfile.ZIP_ZSTANDARD
+
+# 默认使用zstd压缩，当前Python版本不支持时回退到deflate
+DEFAULT_COMPRESSION = 'zstd'
+
+# 其他常见不需要备份的目录
+COMMON_EXCLUDE_DIRS = frozenset(['node_modules', '__pycache__', '.git', '.svn', '.hg', 'vendor', 'dist', 'build'])
+
+# 已经压缩过的文件格式，再次压缩几乎不能减小体积，直接存储
+STORE_EXTS = frozenset(['.gz', '.br', '.zst', '.woff', '.woff2', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif',
+                        '.mp3', '.mp4', '.webm', '.zip', '.7z'])
+
+# 待备份文件数量达到该阈值时才使用多进程压缩，文件较少时进程启动开销得不偿失
+PARALLEL_COMPRESS_MIN_FILES = 16
+
+
+def _compress_file(file_path: str, rel_path: str, compress_type: int = zipfile.ZIP_DEFLATED,
+                   compresslevel: Optional[int] = None) -> Tuple[Optional[zipfile.ZipInfo], Optional[bytes], Optional[str]]:
+    """
+    读取并压缩单个文件，生成可直接写入ZIP的条目信息和压缩数据
+    
+    该函数定义在模块级别，以便在进程池中执行。
+    
+    Args:
+        file_path: 文件路径
+        rel_path: 文件在备份中的相对路径
+        compress_type: ZIP压缩方式
+        compresslevel: 压缩级别，None表示使用默认级别
+        
+    Returns:
+        Tuple: (ZIP条目信息, 压缩后的数据, 错误信息)
+    """
+    try:
+        zinfo = zipfile.ZipInfo.from_file(file_path, rel_path)
+        zinfo.compress_type = compress_type
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        # 使用与zipfile相同的压缩器，生成ZIP条目中保存的原始压缩数据
+        compressor = zipfile._get_compressor(compress_type, compresslevel)
+        compressed = compressor.compress(data) + compressor.flush() if compressor is not None else data
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data)
+        return zinfo, compressed, None
+    except Exception as e:
+        return None, None, str(e)
+
+
+def _write_stored_file(zipf: zipfile.ZipFile, file_path: str, rel_path: str):
+    """
+    以不压缩方式把文件写入ZIP，使用大块缓冲区复制
+    
+    ZipFile.write每次只复制8KB，大文件需要大量Python层循环。
+    
+    Args:
+        zipf: 以写模式打开的ZipFile
+        file_path: 文件路径
+        rel_path: 文件在备份中的相对路径
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, rel_path)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+
+
+def _seek_member_data(fp, zinfo: zipfile.ZipInfo):
+    """
+    跳过条目的本地文件头，将文件位置定位到压缩数据的起始处
+    
+    Args:
+        fp: 以二进制模式打开的ZIP文件对象
+        zinfo: 中央目录中的条目信息
+    """
+    fp.seek(zinfo.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, fp.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"条目的本地文件头损坏: {zinfo.filename}")
+    fp.seek(header[zipfile._FH_FILENAME_LENGTH] + header[zipfile._FH_EXTRA_FIELD_LENGTH], os.SEEK_CUR)
+
+
+def _read_raw_member(fp, zinfo: zipfile.ZipInfo) -> bytes:
+    """
+    从ZIP文件中读取条目未解压的原始压缩数据
+    
+    Args:
+        fp: 以二进制模式打开的ZIP文件对象
+        zinfo: 中央目录中的条目信息
+        
+    Returns:
+        bytes: 原始压缩数据
+    """
+    _seek_member_data(fp, zinfo)
+    return fp.read(zinfo.compress_size)
+
+
+def _clone_zipinfo(zinfo: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """
+    复制条目信息，用于把旧备份中的条目原样写入新备份
+    
+    Args:
+        zinfo: 旧备份中的条目信息
+        
+    Returns:
+        zipfile.ZipInfo: 新的条目信息，CRC和大小保持不变
+    """
+    clone = zipfile.ZipInfo(zinfo.filename, zinfo.date_time)
+    clone.compress_type = zinfo.compress_type
+    clone.create_system = zinfo.create_system
+    clone.external_attr = zinfo.external_attr
+    clone.CRC = zinfo.CRC
+    clone.file_size = zinfo.file_size
+    clone.compress_size = zinfo.compress_size
+    return clone
+
+
+def _duplicate_zipinfo(file_path: str, rel_path: str, source: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    """
+    为内容相同的文件创建条目信息，复用已压缩文件的CRC和大小
+    
+    Args:
+        file_path: 文件路径
+        rel_path: 文件在备份中的相对路径
+        source: 内容相同且已压缩的条目信息
+        
+    Returns:
+        zipfile.ZipInfo: 保留本文件时间和权限的条目信息
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, rel_path)
+    zinfo.compress_type = source.compress_type
+    zinfo.CRC = source.CRC
+    zinfo.file_size = source.file_size
+    zinfo.compress_size = source.compress_size
+    return zinfo
+
+
+def _member_rel_path(filename: str) -> str:
+    """
+    将ZIP条目名转换为安全的相对路径，去除盘符、绝对路径和'..'，与ZipFile.extract的处理一致
+    
+    Args:
+        filename: ZIP条目名
+        
+    Returns:
+        str: 相对路径，条目名无效时返回空字符串
+    """
+    arcname = filename.replace('/', os.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    return os.sep.join(part for part in arcname.split(os.sep) if part not in ('', os.curdir, os.pardir))
+
+
+def _write_precompressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes):
+    """
+    将已压缩好的数据作为一个条目写入ZIP文件
+    
+    CRC和大小已预先计算，本地文件头可以一次写出，无需数据描述符或回写。
+    
+    Args:
+        zipf: 以写模式打开的ZIP文件
+        zinfo: 已填好CRC和大小的条目信息
+        data: 原始deflate压缩数据
+    """
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    with zipf._lock:
+        zipf._writecheck(zinfo)
+        zipf._didModify = True
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(data)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+
+def _probe_raw_zip_write() -> bool:
+    """
+    探测当前Python的zipfile内部接口是否支持直接写入和读取预压缩条目
+    
+    在内存中写入一个预压缩条目，再用公开接口解压并读回原始压缩数据，结果一致才认为可用。
+    
+    Returns:
+        bool: 可以使用预压缩写入和原始条目复用时返回True
+    """
+    try:
+        data = b'seo backup probe ' * 64
+        compressor = zipfile._get_compressor(zipfile.ZIP_DEFLATED, None)
+        compressed = compressor.compress(data) + compressor.flush()
+        zinfo = zipfile.ZipInfo('probe.txt', (2020, 1, 1, 0, 0, 0))
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data)
+        
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zipf:
+            _write_precompressed(zipf, zinfo, compressed)
+        with zipfile.ZipFile(buf, 'r') as zipf:
+            member = zipf.getinfo('probe.txt')
+            return zipf.read(member) == data and _read_raw_member(buf, member) == compressed
+    except Exception:
+        return False
+
+
+# 预压缩条目写入是否可用，不可用时并行压缩、去重和增量复用都会关闭
+_RAW_ZIP_WRITE_SUPPORTED = _probe_raw_zip_write()
+if not _RAW_ZIP_WRITE_SUPPORTED:
+    logger.warning("当前Python的zipfile不支持预压缩条目写入，备份将逐个压缩文件，不使用并行压缩和增量复用")
+
+
+def _probe_member_reader() -> bool:
+    """
+    探测能否跳过本地文件头后直接用zipfile.ZipExtFile读取条目，供恢复线程使用独立的映射视图
+    
+    Returns:
+        bool: 读取结果与写入内容一致时返回True
+    """
+    try:
+        data = b'seo backup probe ' * 64
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr('probe.txt', data)
+        with zipfile.ZipFile(buf, 'r') as zipf:
+            zinfo = zipf.getinfo('probe.txt')
+        _seek_member_data(buf, zinfo)
+        with zipfile.ZipExtFile(buf, 'r', zinfo) as member:
+            return member.read() == data
+    except Exception:
+        return False
+
+
+# 恢复线程能否通过各自的映射视图读取条目，不可用时改为通过共享的ZipFile.open读取
+_MEMBER_READER_SUPPORTED = _probe_member_reader()
+if not _MEMBER_READER_SUPPORTED:
+    logger.warning("当前Python的zipfile不支持直接构造条目读取器，恢复时改用ZipFile.open读取")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    将对象序列化为紧凑的UTF-8 JSON字节串，优先使用orjson
+    
+    Args:
+        obj: 要序列化的对象
+        
+    Returns:
+        bytes: JSON字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _temp_path_for(file_path: str) -> str:
+    """
+    生成与目标文件同目录的临时文件路径，包含进程和线程ID，多个写入方不会互相覆盖
+    
+    Args:
+        file_path: 目标文件路径
+        
+    Returns:
+        str: 临时文件路径
+    """
+    return f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _atomic_write_bytes(file_path: str, data: bytes):
+    """
+    原子地写入文件：数据一次性写入临时文件并刷到磁盘后再替换目标文件，
+    读取方不会看到写了一半的内容
+    
+    Args:
+        file_path: 目标文件路径
+        data: 要写入的数据
+    """
+    # 临时文件名包含进程和线程ID，多个实例同时保存同一文件时不会写入同一个临时文件
+    tmp_path = _temp_path_for(file_path)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # 写入失败时删除临时文件，不在备份目录中留下残留
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _json_load_file(file_path: str) -> Any:
+    """
+    读取并解析JSON文件，优先使用orjson
+    
+    Args:
+        file_path: JSON文件路径
+        
+    Returns:
+        Any: 解析结果
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _MappedFile(mmap.mmap):
+    """只读映射的备份文件，补充zipfile读取条目时需要的seekable方法（Python 3.13之前mmap没有该方法）"""
+    
+    def seekable(self):
+        return True
+
+
+class _MemberReader:
+    """
+    为每个恢复线程提供独立的备份文件映射视图
+    
+    中央目录只由一个ZipFile解析一次；各线程通过自己的视图读取条目数据，
+    不再争用ZipFile对共享文件加的锁。zipfile内部接口不可用时退回共享ZipFile的open方法。
+    """
+    
+    def __init__(self, zipf: zipfile.ZipFile, fileno: int, advice: Optional[int] = None):
+        self._zipf = zipf
+        self._fileno = fileno
+        self._advice = advice
+        self._local = threading.local()
+        self._views = []
+    
+    def open(self, zinfo: zipfile.ZipInfo) -> zipfile.ZipExtFile:
+        """
+        打开条目用于读取，解压时校验CRC-32
+        
+        Args:
+            zinfo: 中央目录中的条目信息
+            
+        Returns:
+            zipfile.ZipExtFile: 条目的只读文件对象
+        """
+        if not _MEMBER_READER_SUPPORTED:
+            return self._zipf.open(zinfo)
+        if zinfo.flag_bits & 0x1:
+            raise RuntimeError(f"不支持加密的备份条目: {zinfo.filename}")
+        view = getattr(self._local, 'view', None)
+        if view is None:
+            view = self._local.view = _MappedFile(self._fileno, 0, access=mmap.ACCESS_READ)
+            if self._advice is not None and hasattr(view, 'madvise'):
+                view.madvise(self._advice)
+            self._views.append(view)
+        _seek_member_data(view, zinfo)
+        return zipfile.ZipExtFile(view, 'r', zinfo)
+    
+    def close(self):
+        for view in self._views:
+            view.close()
+        self._views.clear()
+
+
+class _HashingWriter:
+    """写入时同步计算哈希和字节数的文件包装器，避免写完后再次读取整个文件"""
+    
+    def __init__(self, f, hasher):
+        self._f = f
+        self._hasher = hasher
+        self.bytes_written = 0
+    
+    def write(self, data) -> int:
+        self._hasher.update(data)
+        n = self._f.write(data)
+        self.bytes_written += n
+        return n
+    
+    def tell(self) -> int:
+        return self._f.tell()
+    
+    def flush(self):
+        self._f.flush()
+
 
 class BackupManager:
     """备份和恢复管理器，负责网站文件的备份和恢复操作"""
@@ -24,55 +450,22 @@ class BackupManager:
         Args:
             config_manager: 配置管理器实例
         """
-        logger.info("开始初始化BackupManager")
-        logger.info(f"传入的config_manager类型: {type(config_manager)}")
+        logger.debug("开始初始化BackupManager")
         
         # 防御性检查：确保传入的是ConfigManager实例
         if not isinstance(config_manager, ConfigManager):
-            logger.error(f"传入的参数不是ConfigManager实例: {type(config_manager)}")
+            logger.error("传入的参数不是ConfigManager实例: %s", type(config_manager))
             # 创建一个默认的ConfigManager实例作为后备
             config_manager = ConfigManager()
         
         self.config_manager = config_manager
         
-        # 获取配置项 - 添加严格的类型检查
+        # 获取配置项，类型不符时回退到默认值
         try:
-            # 获取网站路径
-            site_path = config_manager.get_config('site_path')
-            logger.info(f"从配置获取site_path: {site_path}, 类型: {type(site_path).__name__ if site_path is not None else 'None'}")
-            
-            # 确保site_path是字符串
-            if site_path is None or not isinstance(site_path, str):
-                logger.warning(f"网站路径无效或不是字符串类型，使用当前目录")
-                self.site_path = '.'
-            else:
-                self.site_path = site_path
-            
-            logger.info(f"最终使用的site_path: {self.site_path}, 类型: {type(self.site_path).__name__}")
-            
-            # 获取备份配置
-            backup_config = config_manager.get_config('backup_config')
-            logger.info(f"从配置获取backup_config: {backup_config}, 类型: {type(backup_config).__name__ if backup_config is not None else 'None'}")
-            
-            # 确保backup_config是字典类型
-            if isinstance(backup_config, ConfigManager):
-                logger.error("错误：backup_config是ConfigManager实例，这是不允许的")
-                self.backup_config = {}
-            else:
-                self.backup_config = backup_config if isinstance(backup_config, dict) else {}
-            
-            logger.info(f"最终使用的backup_config: {self.backup_config}, 类型: {type(self.backup_config).__name__}")
-            
-            # 获取其他配置项，同样进行防御性检查
-            file_types = config_manager.get_config('file_types')
-            self.file_types = {}
-            if file_types is not None and isinstance(file_types, dict) and not isinstance(file_types, ConfigManager):
-                self.file_types = file_types
-                
-            exclude_patterns = config_manager.get_config('exclude_patterns')
-            self.exclude_patterns = []
-            if exclude_patterns is not None and isinstance(exclude_patterns, list) and not isinstance(exclude_patterns, ConfigManager):
-                self.exclude_patterns = exclude_patterns
+            self.site_path = self._coerce(config_manager.get_config('site_path'), str, '.', 'site_path')
+            self.backup_config = self._coerce(config_manager.get_config('backup_config'), dict, {}, 'backup_config')
+            self.file_types = self._coerce(config_manager.get_config('file_types'), dict, {}, 'file_types')
+            self.exclude_patterns = self._coerce(config_manager.get_config('exclude_patterns'), list, [], 'exclude_patterns')
         except Exception as e:
             logger.error(f"获取配置项时发生错误: {str(e)}")
             # 设置默认值
@@ -81,50 +474,51 @@ class BackupManager:
             self.file_types = {}
             self.exclude_patterns = []
         
-        # 备份存储路径 - 确保返回的是字符串
+        # 备份存储路径
         try:
             self.backup_dir = self._get_backup_directory()
-            # 额外检查backup_dir是否为字符串
-            if not isinstance(self.backup_dir, str):
-                logger.error(f"_get_backup_directory返回非字符串类型: {type(self.backup_dir)}")
-                self.backup_dir = './seo_backups'
         except Exception as e:
             logger.error(f"获取备份目录时发生错误: {str(e)}")
             self.backup_dir = './seo_backups'
         
-        logger.info(f"最终使用的backup_dir: {self.backup_dir}, 类型: {type(self.backup_dir).__name__}")
+        logger.debug("使用的site_path: %s, backup_dir: %s", self.site_path, self.backup_dir)
         
         # 最近一次备份信息
         self.last_backup_info = None
         
-        # 确保备份目录存在 - 添加严格的类型检查
+        # 备份索引，首次使用时加载，避免每次查询都读取所有备份信息文件；
+        # 同时记录index.json的文件状态，其他实例或进程修改索引后重新读取
+        self._index_path = os.path.join(self.backup_dir, 'index.json')
+        self._index = None
+        self._index_sig = None
+        
+        # 备份压缩方式和压缩级别
+        self.compression = self._resolve_compression(self.backup_config.get('compression', DEFAULT_COMPRESSION))
+        self.compress_level = self.backup_config.get('compress_level')
+        
+        # 备份完整性校验使用的哈希算法
+        self.hash_algo = self._resolve_hash_algo(self.backup_config.get('backup_hash_algo', DEFAULT_HASH_ALGO))
+        # 默认只校验ZIP条目的CRC-32，开启后恢复前额外校验整个备份文件的哈希
+        self.paranoid_verify = bool(self.backup_config.get('paranoid_verify', False))
+        
+        # 其余备份配置只在初始化时读取一次
+        self._keep_backups = self._coerce(self.backup_config.get('keep_backups'), int, 5, 'keep_backups')
+        self._incremental = bool(self.backup_config.get('incremental', True))
+        self._max_workers = self._coerce(self.backup_config.get('max_workers'), int, None, 'max_workers')
+        
+        # 预编译排除规则并缓存需要备份的扩展名，_should_exclude对每个文件和目录都会调用
+        self._exclude_literals, self._exclude_re = self._compile_exclude_patterns(self.exclude_patterns)
+        # 按目录名排除的目录集合，遍历时先按名称过滤，无需再匹配排除模式
+        self._exclude_dirs = COMMON_EXCLUDE_DIRS | frozenset(self.backup_config.get('exclude_dirs', []))
+        self._backup_extensions = (
+            frozenset(self.file_types.get('html', ['.html', '.htm']))
+            | frozenset(self.file_types.get('css', ['.css']))
+            | frozenset(self.file_types.get('javascript', ['.js']))
+        )
+        
+        # 确保备份目录存在
         try:
-            logger.info(f"开始创建备份目录: {self.backup_dir}")
-            
-            # 双重确保backup_dir是字符串
-            if isinstance(self.backup_dir, str):
-                # 再次检查路径参数，确保不是ConfigManager对象
-                if 'ConfigManager' in str(type(self.backup_dir)):
-                    raise TypeError("路径不能是ConfigManager对象")
-                
-                os.makedirs(self.backup_dir, exist_ok=True)
-                logger.info(f"备份目录创建成功: {self.backup_dir}")
-            else:
-                logger.error(f"备份目录不是字符串类型: {type(self.backup_dir)}")
-                # 使用当前目录作为备份目录
-                self.backup_dir = './seo_backups'
-                os.makedirs(self.backup_dir, exist_ok=True)
-                logger.info(f"使用默认备份目录: {self.backup_dir}")
-        except TypeError as e:
-            logger.error(f"创建备份目录时发生类型错误: {str(e)}")
-            # 特别处理ConfigManager相关的错误
-            if 'ConfigManager' in str(e):
-                logger.error("错误：ConfigManager对象被错误地用作路径")
-                logger.error(f"导致错误的对象类型: {type(self.backup_dir)}")
-            # 使用当前目录作为备份目录
-            self.backup_dir = './seo_backups'
             os.makedirs(self.backup_dir, exist_ok=True)
-            logger.info(f"使用默认备份目录: {self.backup_dir}")
         except Exception as e:
             logger.error(f"创建备份目录失败: {str(e)}")
             # 使用当前目录作为备份目录
@@ -132,7 +526,37 @@ class BackupManager:
             os.makedirs(self.backup_dir, exist_ok=True)
             logger.info(f"使用默认备份目录: {self.backup_dir}")
         
-        logger.info("BackupManager初始化完成")
+        # 预先计算站点路径前缀长度，遍历时直接切片得到相对路径
+        self._site_prefix_len = len(os.path.join(self.site_path, ''))
+        # 备份目录位于站点内时，记录其相对路径前缀（以分隔符结尾），用于startswith判断
+        site_abs = os.path.join(os.path.abspath(self.site_path), '')
+        self.backup_dir_abs = os.path.join(os.path.abspath(self.backup_dir), '')
+        if self.backup_dir_abs.startswith(site_abs):
+            self._backup_rel_prefix = self.backup_dir_abs[len(site_abs):]
+        else:
+            self._backup_rel_prefix = None
+        
+        logger.debug("BackupManager初始化完成")
+    
+    @staticmethod
+    def _coerce(value: Any, expected_type: type, default: Any, name: str) -> Any:
+        """
+        校验配置值类型，不符合时记录一次警告并返回默认值
+        
+        Args:
+            value: 配置值
+            expected_type: 期望的类型
+            default: 默认值
+            name: 配置项名称，用于日志
+            
+        Returns:
+            Any: 校验后的配置值
+        """
+        if isinstance(value, expected_type):
+            return value
+        if value is not None:
+            logger.warning("配置项%s类型无效: %s，使用默认值", name, type(value).__name__)
+        return default
     
     def _get_backup_directory(self) -> str:
         """
@@ -141,64 +565,15 @@ class BackupManager:
         Returns:
             str: 备份目录路径
         """
-        try:
-            logger.info("开始获取备份目录")
-            
-            # 添加调试信息
-            logger.info(f"backup_config类型: {type(self.backup_config)}, 值: {self.backup_config}")
-            logger.info(f"site_path类型: {type(self.site_path)}, 值: {self.site_path}")
-            
-            # 默认备份目录
-            default_backup_dir = './seo_backups'
-            
-            # 从配置中获取备份路径，如果没有则使用默认路径
-            backup_dir = None
-            if isinstance(self.backup_config, dict):
-                backup_dir = self.backup_config.get('backup_directory')
-                logger.info(f"从backup_config获取的backup_dir: {backup_dir}")
-                
-                # 检查backup_dir是否为ConfigManager实例
-                if isinstance(backup_dir, ConfigManager):
-                    logger.error("错误：backup_directory是ConfigManager实例，这是不允许的")
-                    backup_dir = None
-                # 检查backup_dir是否为字符串类型
-                elif backup_dir is not None and not isinstance(backup_dir, str):
-                    logger.error(f"backup_directory不是字符串类型: {type(backup_dir)}")
-                    backup_dir = None
-            
-            # 如果没有有效的备份路径，则使用默认路径
-            if not backup_dir:
-                logger.info("没有有效的备份路径配置，使用默认路径")
-                
-                # 尝试基于site_path构建默认路径
-                if isinstance(self.site_path, str) and self.site_path != '.':
-                    try:
-                        parent_dir = os.path.dirname(self.site_path)
-                        # 再次确保parent_dir是字符串
-                        if isinstance(parent_dir, str):
-                            backup_dir = os.path.join(parent_dir, 'seo_backups')
-                            logger.info(f"使用基于site_path的默认备份路径: {backup_dir}")
-                        else:
-                            logger.error(f"parent_dir不是字符串类型: {type(parent_dir)}")
-                            backup_dir = default_backup_dir
-                    except Exception as e:
-                        logger.error(f"构建默认备份路径失败: {str(e)}")
-                        backup_dir = default_backup_dir
-                else:
-                    backup_dir = default_backup_dir
-                    logger.info(f"使用当前目录作为备份目录: {backup_dir}")
-            
-            # 最终验证backup_dir是字符串
-            if not isinstance(backup_dir, str):
-                logger.error(f"backup_dir不是字符串类型: {type(backup_dir)}")
-                backup_dir = default_backup_dir
-            
-            logger.info(f"最终返回的备份目录: {backup_dir}, 类型: {type(backup_dir).__name__}")
+        # 从配置中获取备份路径
+        backup_dir = self._coerce(self.backup_config.get('backup_directory'), str, None, 'backup_directory')
+        if backup_dir:
             return backup_dir
-        except Exception as e:
-            logger.error(f"获取备份目录失败: {str(e)}")
-            logger.error(f"异常类型: {type(e).__name__}")
-            return './seo_backups'
+        
+        # 没有有效的备份路径配置时，尝试基于site_path构建默认路径
+        if self.site_path != '.':
+            return os.path.join(os.path.dirname(self.site_path), 'seo_backups')
+        return './seo_backups'
     
     def create_backup(self, description: str = "") -> Dict[str, Any]:
         """
@@ -228,44 +603,106 @@ class BackupManager:
             stats = {
                 'total_files': 0,
                 'backup_files': 0,
+                'reused_files': 0,
+                'deduplicated_files': 0,
                 'skipped_files': 0,
                 'error_files': 0
             }
             
-            # 创建ZIP文件
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 遍历网站目录并添加文件到ZIP
-                for root, dirs, files in os.walk(self.site_path):
-                    # 过滤目录
-                    dirs[:] = [d for d in dirs if not self._should_exclude(os.path.join(root, d), 'dir')]
-                    
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        
-                        # 检查是否应该排除此文件
-                        if self._should_exclude(file_path, 'file'):
-                            stats['skipped_files'] += 1
-                            continue
-                        
-                        # 计算相对路径
-                        rel_path = os.path.relpath(file_path, self.site_path)
-                        
-                        try:
-                            # 添加文件到ZIP
-                            zipf.write(file_path, rel_path)
-                            stats['backup_files'] += 1
-                            logger.debug(f"备份文件: {rel_path}")
-                        except Exception as e:
-                            stats['error_files'] += 1
-                            logger.warning(f"备份文件失败 {file_path}: {str(e)}")
-                        finally:
-                            stats['total_files'] += 1
+            # 先遍历网站目录收集待备份文件及其大小和修改时间，排除规则在压缩前应用
+            file_entries = []
+            for entry in self._iter_files(self.site_path, stats):
+                try:
+                    st = entry.stat()
+                    size, mtime_ns = st.st_size, st.st_mtime_ns
+                except OSError:
+                    # 无法获取状态的文件不参与增量复用，写入时再记录错误
+                    size, mtime_ns = -1, -1
+                file_entries.append((entry.path, entry.path[self._site_prefix_len:], size, mtime_ns))
             
-            # 计算备份文件大小
-            backup_size = os.path.getsize(backup_path)
+            # 增量备份：与上一次备份相比大小和修改时间都未变化的文件直接复用其压缩数据
+            base_id, reusable, base_path = self._load_incremental_base(backup_id, file_entries)
             
-            # 计算备份文件MD5
-            backup_md5 = self._calculate_file_md5(backup_path)
+            # 只压缩发生变化的文件，内容相同的文件只压缩一次，其余副本复用压缩数据；
+            # 已压缩格式的文件写入时直接流式存储，不读入内存，也不参与去重和并行压缩
+            changed_entries = [entry for entry in file_entries
+                               if entry[1] not in reusable and self._compress_type_for(entry[1]) != zipfile.ZIP_STORED]
+            duplicates = self._find_duplicate_files(changed_entries) if _RAW_ZIP_WRITE_SUPPORTED else {}
+            canonical_paths = set(duplicates.values())
+            unique_entries = [(entry[0], entry[1]) for entry in changed_entries if entry[1] not in duplicates]
+            
+            # 文件较多时使用多进程并行压缩，主进程按顺序逐个取出结果写入，
+            # 只保留有重复副本的文件的压缩数据
+            compressed = None
+            parallel_paths = frozenset()
+            if _RAW_ZIP_WRITE_SUPPORTED and len(unique_entries) >= PARALLEL_COMPRESS_MIN_FILES:
+                compressed = self._compress_files(unique_entries)
+                parallel_paths = frozenset(entry[1] for entry in unique_entries)
+            compressed_files = {}
+            
+            # 创建ZIP文件，写入的同时计算哈希。包装器不支持seek，
+            # zipfile会改用数据描述符记录CRC和大小，不再回写已写出的字节
+            hasher = self._new_hasher(self.hash_algo)
+            manifest = {}
+            base_fp = open(base_path, 'rb') if reusable else None
+            try:
+                with open(backup_path, 'wb') as raw:
+                    writer = _HashingWriter(raw, hasher)
+                    with zipfile.ZipFile(writer, 'w', self.compression, compresslevel=self.compress_level) as zipf:
+                        for file_path, rel_path, size, mtime_ns in file_entries:
+                            try:
+                                # 添加文件到ZIP
+                                base_zinfo = reusable.get(rel_path)
+                                source = compressed_files.get(duplicates.get(rel_path))
+                                if base_zinfo is not None:
+                                    _write_precompressed(zipf, _clone_zipinfo(base_zinfo), _read_raw_member(base_fp, base_zinfo))
+                                    stats['reused_files'] += 1
+                                elif source is not None and source[2] is None:
+                                    source_zinfo, data, _ = source
+                                    _write_precompressed(zipf, _duplicate_zipinfo(file_path, rel_path, source_zinfo), data)
+                                    stats['deduplicated_files'] += 1
+                                else:
+                                    if rel_path in parallel_paths:
+                                        result = next(compressed)
+                                        if rel_path in canonical_paths:
+                                            compressed_files[rel_path] = result
+                                    else:
+                                        result = compressed_files.get(rel_path)
+                                    compress_type = self._compress_type_for(rel_path)
+                                    if result is None and (rel_path in canonical_paths or rel_path in duplicates):
+                                        # 有重复副本的文件在主进程中压缩，供后续副本复用
+                                        result = compressed_files[rel_path] = _compress_file(
+                                            file_path, rel_path, compress_type, self.compress_level)
+                                    if result is None and compress_type == zipfile.ZIP_STORED:
+                                        _write_stored_file(zipf, file_path, rel_path)
+                                    elif result is None:
+                                        zipf.write(file_path, rel_path, compress_type=compress_type)
+                                    else:
+                                        zinfo, data, error = result
+                                        if error is not None:
+                                            raise OSError(error)
+                                        _write_precompressed(zipf, zinfo, data)
+                                stats['backup_files'] += 1
+                                manifest[rel_path.replace(os.sep, '/')] = [size, mtime_ns]
+                                logger.debug(f"备份文件: {rel_path}")
+                            except Exception as e:
+                                stats['error_files'] += 1
+                                logger.warning(f"备份文件失败 {file_path}: {str(e)}")
+                            finally:
+                                stats['total_files'] += 1
+            finally:
+                if compressed is not None:
+                    compressed.close()
+                if base_fp is not None:
+                    base_fp.close()
+            
+            # 保存文件清单，供下一次增量备份判断文件是否变化
+            manifest_path = os.path.join(self.backup_dir, f"manifest_{backup_id}.json")
+            _atomic_write_bytes(manifest_path, _json_dumps(manifest))
+            
+            # 备份文件大小和哈希在写入时已得到
+            backup_size = writer.bytes_written
+            backup_hash = hasher.hexdigest()
             
             # 备份信息
             backup_info = {
@@ -275,15 +712,22 @@ class BackupManager:
                 'site_path': self.site_path,
                 'backup_path': backup_path,
                 'backup_size': backup_size,
-                'backup_md5': backup_md5,
+                'backup_hash': backup_hash,
+                'backup_hash_algo': self.hash_algo,
+                'incremental_base_id': base_id,
                 'stats': stats,
                 'duration_seconds': (datetime.datetime.now() - start_time).total_seconds()
             }
             
             # 保存备份信息到JSON文件
             info_file_path = os.path.join(self.backup_dir, f"{backup_id}.json")
-            with open(info_file_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_info, f, ensure_ascii=False, indent=2)
+            _atomic_write_bytes(info_file_path, _json_dumps(backup_info))
+            
+            # 更新备份索引
+            index = self._load_index()
+            index['backups'] = [b for b in index['backups'] if b.get('backup_id') != backup_id]
+            index['backups'].append(backup_info)
+            self._save_index()
             
             # 更新最近备份信息
             self.last_backup_info = backup_info
@@ -305,108 +749,368 @@ class BackupManager:
                 'error': str(e)
             }
     
-    def _should_exclude(self, path: str, item_type: str) -> bool:
+    def _load_incremental_base(self, backup_id: str, file_entries: List[Tuple[str, str, int, int]]) -> Tuple[Optional[str], Dict[str, zipfile.ZipInfo], Optional[str]]:
         """
-        判断是否应该排除指定的路径
+        查找上一次备份中可以直接复用的文件条目
         
         Args:
-            path: 要检查的路径
-            item_type: 项目类型 ('file' 或 'dir')
+            backup_id: 本次备份ID
+            file_entries: (文件路径, 相对路径, 大小, 修改时间ns) 列表
             
         Returns:
-            bool: 如果应该排除则返回True
+            Tuple: (基准备份ID, 相对路径 -> 基准备份中的条目信息, 基准备份文件路径)；没有可用基准时返回 (None, {}, None)
         """
-        # 相对路径用于模式匹配
-        rel_path = os.path.relpath(path, self.site_path)
+        if not self._incremental or not _RAW_ZIP_WRITE_SUPPORTED:
+            return None, {}, None
         
-        # 检查排除模式
-        for pattern in self.exclude_patterns:
-            # 转换路径分隔符为统一格式
-            pattern_norm = pattern.replace('/', os.path.sep).replace('\\', os.path.sep)
+        base_info = self.get_latest_backup_info()
+        if not base_info or base_info.get('site_path') != self.site_path or base_info.get('backup_id') == backup_id:
+            return None, {}, None
+        
+        base_path = base_info.get('backup_path', '')
+        manifest_path = os.path.join(self.backup_dir, f"manifest_{base_info['backup_id']}.json")
+        if not os.path.exists(base_path) or not os.path.exists(manifest_path):
+            return None, {}, None
+        
+        try:
+            base_manifest = _json_load_file(manifest_path)
+            with zipfile.ZipFile(base_path, 'r') as zipf:
+                base_infos = {zinfo.filename: zinfo for zinfo in zipf.infolist()}
+        except Exception as e:
+            logger.warning(f"读取增量备份基准失败，执行完整备份: {str(e)}")
+            return None, {}, None
+        
+        reusable = {}
+        for _, rel_path, size, mtime_ns in file_entries:
+            arcname = rel_path.replace(os.sep, '/')
+            if arcname in base_infos and base_manifest.get(arcname) == [size, mtime_ns]:
+                reusable[rel_path] = base_infos[arcname]
+        
+        return base_info['backup_id'], reusable, base_path
+    
+    def _iter_files(self, root: str, stats: Dict[str, int]):
+        """
+        基于os.scandir递归遍历目录，逐个产出需要备份的文件
+        
+        复用DirEntry中缓存的类型信息，避免os.walk为每个条目额外调用stat。
+        与os.walk一致，不进入指向目录的符号链接，无法读取的目录直接跳过。
+        
+        Args:
+            root: 要遍历的目录
+            stats: 备份统计信息，被排除的文件会计入skipped_files
             
-            # 检查路径是否匹配模式
-            if self._match_pattern(rel_path, pattern_norm):
-                return True
+        Yields:
+            os.DirEntry: 需要备份的文件条目
+        """
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning(f"无法读取目录 {root}: {str(e)}")
+            return
         
-        # 检查文件类型
-        if item_type == 'file':
-            # 获取文件扩展名
-            ext = os.path.splitext(path)[1].lower()
+        for entry in entries:
+            if entry.is_dir():
+                # 过滤目录，按名称排除的目录直接跳过
+                if entry.name in self._exclude_dirs or entry.is_symlink() or self._should_exclude(entry.path, 'dir'):
+                    continue
+                yield from self._iter_files(entry.path, stats)
+            elif self._should_exclude(entry.path, 'file'):
+                stats['skipped_files'] += 1
+            else:
+                yield entry
+    
+    def _find_duplicate_files(self, file_entries: List[Tuple[str, str, int, int]]) -> Dict[str, str]:
+        """
+        找出内容完全相同的文件，只对大小相同的文件计算内容哈希
+        
+        Args:
+            file_entries: (文件路径, 相对路径, 大小, 修改时间ns) 列表
+            
+        Returns:
+            Dict: 重复文件的相对路径 -> 第一个相同内容文件的相对路径
+        """
+        by_size = {}
+        for file_path, rel_path, size, _ in file_entries:
+            if size >= 0:
+                by_size.setdefault(size, []).append((file_path, rel_path))
+        
+        duplicates = {}
+        for group in by_size.values():
+            if len(group) < 2:
+                continue
+            first_by_digest = {}
+            for file_path, rel_path in group:
+                try:
+                    digest = self._digest_file(file_path, hashlib.blake2b)
+                except OSError:
+                    continue
+                canonical = first_by_digest.setdefault(digest, rel_path)
+                if canonical != rel_path:
+                    duplicates[rel_path] = canonical
+        return duplicates
+    
+    def _compress_files(self, file_entries: List[Tuple[str, str]]) -> Iterator[Tuple[Optional[zipfile.ZipInfo], Optional[bytes], Optional[str]]]:
+        """
+        使用进程池并行压缩待备份文件，按顺序逐个产出压缩结果
+        
+        同时提交到进程池的文件数不超过工作进程数的两倍，已压缩但尚未写入的数据不会随站点大小增长。
+        进程池不可用时，剩余文件改为在当前进程中压缩。
+        
+        Args:
+            file_entries: (文件路径, 相对路径) 列表
+            
+        Yields:
+            Tuple: 与file_entries一一对应的压缩结果 (ZIP条目信息, 压缩后的数据, 错误信息)
+        """
+        compress = functools.partial(_compress_file, compresslevel=self.compress_level)
+        window = (self._max_workers or os.cpu_count() or 1) * 2
+        pending = deque()
+        
+        try:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        except Exception as e:
+            logger.warning(f"并行压缩文件失败，改为顺序压缩: {str(e)}")
+            executor = None
+        
+        def take():
+            nonlocal executor
+            args, future = pending.popleft()
+            if future is not None:
+                try:
+                    return future.result()
+                except Exception as e:
+                    if executor is not None:
+                        logger.warning(f"并行压缩文件失败，改为顺序压缩: {str(e)}")
+                        executor.shutdown(wait=False)
+                        executor = None
+            return compress(*args)
+        
+        try:
+            for file_path, rel_path in file_entries:
+                args = (file_path, rel_path, self._compress_type_for(rel_path))
+                future = None
+                if executor is not None:
+                    try:
+                        future = executor.submit(compress, *args)
+                    except Exception as e:
+                        logger.warning(f"并行压缩文件失败，改为顺序压缩: {str(e)}")
+                        executor.shutdown(wait=False)
+                        executor = None
+                pending.append((args, future))
+                
+                while len(pending) >= window or (executor is None and pending):
+                    yield take()
             
-            # 检查是否在需要备份的类型中
-            html_exts = self.file_types.get('html', ['.html', '.htm'])
-            css_exts = self.file_types.get('css', ['.css'])
-            js_exts = self.file_types.get('javascript', ['.js'])
+            while pending:
+                yield take()
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
+    
+    def _compress_type_for(self, rel_path: str) -> int:
+        """
+        根据扩展名选择文件的压缩方式，已压缩格式的文件直接存储
+        
+        Args:
+            rel_path: 文件相对路径
             
-            # 只备份指定类型的文件
-            backup_extensions = html_exts + css_exts + js_exts
+        Returns:
+            int: ZIP压缩方式
+        """
+        _, dot, ext = rel_path.rpartition('.')
+        if dot and '.' + ext.lower() in STORE_EXTS:
+            return zipfile.ZIP_STORED
+        return self.compression
+    
+    def _should_exclude(self, path: str, item_type: str) -> bool:
+        """
+        判断是否应该排除指定的路径
+        
+        Args:
+            path: 要检查的路径
+            item_type: 项目类型 ('file' 或 'dir')
             
-            if ext not in backup_extensions:
-                return True
+        Returns:
+            bool: 如果应该排除则返回True
+        """
+        # 路径均由站点目录拼接而来，直接切片得到相对路径用于模式匹配
+        rel_path = path[self._site_prefix_len:]
+        name = path[path.rfind(os.sep) + 1:]
         
         # 排除隐藏文件和目录
-        basename = os.path.basename(path)
-        if basename.startswith('.'):
+        if name.startswith('.'):
             return True
         
-        # 排除备份目录本身
-        if os.path.commonpath([path, self.backup_dir]) == self.backup_dir:
+        # 排除常见不需要备份的目录
+        if item_type == 'dir' and name in self._exclude_dirs:
             return True
         
-        # 排除其他常见不需要备份的目录
-        common_exclude_dirs = ['node_modules', '__pycache__', '.git', '.svn', '.hg', 'vendor', 'dist', 'build']
-        if item_type == 'dir' and basename in common_exclude_dirs:
+        # 检查排除模式：不含通配符的模式直接查集合，其余模式已合并为一个正则
+        if rel_path in self._exclude_literals:
+            return True
+        if self._exclude_re is not None and self._exclude_re.match(rel_path):
+            return True
+        
+        # 检查文件类型，只备份指定类型的文件
+        if item_type == 'file':
+            _, dot, ext = name.rpartition('.')
+            if not dot or '.' + ext.lower() not in self._backup_extensions:
+                return True
+        
+        # 排除备份目录本身
+        if self._backup_rel_prefix is not None and (rel_path + os.sep).startswith(self._backup_rel_prefix):
             return True
         
         return False
     
-    def _match_pattern(self, path: str, pattern: str) -> bool:
+    def _compile_exclude_patterns(self, patterns: List[str]) -> Tuple[frozenset, Optional[re.Pattern]]:
         """
-        检查路径是否匹配模式
+        预处理排除模式：不含通配符的模式放入集合做精确匹配，其余模式合并编译为一个正则表达式
         
         Args:
-            path: 要检查的路径
-            pattern: 模式字符串，支持通配符 * 和 ?
+            patterns: 排除模式列表，支持通配符 * 和 ?，需匹配整个相对路径
             
         Returns:
-            bool: 如果路径匹配模式则返回True
+            Tuple: (精确匹配的路径集合, 编译后的正则表达式，没有通配符模式时为None)
         """
-        # 简化的通配符匹配
-        # 将模式转换为正则表达式
-        regex_pattern = pattern.replace('.', '\\.')
-        regex_pattern = regex_pattern.replace('*', '.*')
-        regex_pattern = regex_pattern.replace('?', '.')
-        regex_pattern = f"^{regex_pattern}$"
+        literals = set()
+        translated = []
+        for pattern in patterns:
+            # 转换路径分隔符为统一格式
+            pattern_norm = pattern.replace('/', os.path.sep).replace('\\', os.path.sep)
+            if any(c in pattern_norm for c in '*?['):
+                translated.append(fnmatch.translate(pattern_norm))
+            else:
+                literals.add(pattern_norm)
         
-        import re
-        return bool(re.match(regex_pattern, path))
+        exclude_re = re.compile('|'.join(translated)) if translated else None
+        return frozenset(literals), exclude_re
     
-    def _calculate_file_md5(self, file_path: str) -> str:
+    def _resolve_compression(self, method: str) -> int:
+        """
+        解析配置的压缩方式，当前Python版本不支持时回退到deflate
+        
+        Args:
+            method: 配置的压缩方式 ('zstd', 'deflate', 'bzip2', 'lzma' 或 'stored')
+            
+        Returns:
+            int: zipfile压缩方式常量
+        """
+        if method not in COMPRESSION_METHODS:
+            if method != 'zstd':
+                logger.warning(f"不支持的压缩方式 {method}，使用deflate")
+            return zipfile.ZIP_DEFLATED
+        return COMPRESSION_METHODS[method]
+    
+    def _resolve_hash_algo(self, algo: str) -> str:
+        """
+        解析配置的哈希算法，可选依赖未安装时回退到可用的算法
+        
+        Args:
+            algo: 配置的算法名称 ('blake3', 'xxh3', 'blake2b' 或 'md5')
+            
+        Returns:
+            str: 实际使用的算法名称
+        """
+        if algo == 'blake3' and blake3 is None:
+            algo = 'xxh3'
+        if algo == 'xxh3' and xxhash is None:
+            algo = 'blake2b'
+        if algo not in ('blake3', 'xxh3', 'blake2b', 'md5'):
+            logger.warning(f"不支持的哈希算法 {algo}，使用blake2b")
+            algo = 'blake2b'
+        return algo
+    
+    def _new_hasher(self, algo: str) -> Any:
+        """
+        创建指定算法的增量哈希对象
+        
+        Args:
+            algo: 哈希算法名称
+            
+        Returns:
+            Any: 支持update()和hexdigest()的哈希对象
         """
-        计算文件的MD5哈希值
+        if algo == 'blake3':
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if algo == 'xxh3':
+            return xxhash.xxh3_128()
+        if algo == 'md5':
+            return hashlib.md5()
+        return hashlib.blake2b()
+    
+    def _calculate_file_hash(self, file_path: str, algo: str) -> str:
+        """
+        计算文件的哈希值
         
         Args:
             file_path: 文件路径
+            algo: 哈希算法名称
             
         Returns:
-            str: MD5哈希值
+            str: 十六进制哈希值，计算失败时返回空字符串
         """
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b"").send(None):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            if algo == 'blake3':
+                # blake3通过mmap读取文件并在内部多线程计算
+                hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                hasher.update_mmap(file_path)
+                return hasher.hexdigest()
+            return self._digest_file(file_path, lambda: self._new_hasher(algo))
         except Exception as e:
-            logger.error(f"计算文件MD5失败 {file_path}: {str(e)}")
+            logger.error(f"计算文件哈希失败 {file_path}: {str(e)}")
             return ""
     
-    def restore_from_backup(self, backup_id: str = None) -> Dict[str, Any]:
+    def _calculate_file_md5(self, file_path: str) -> str:
+        """
+        计算文件的MD5哈希值，用于校验旧版本创建的备份
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            str: MD5哈希值
+        """
+        return self._calculate_file_hash(file_path, 'md5')
+    
+    def _digest_file(self, file_path: str, hash_factory: Callable[[], Any]) -> str:
+        """
+        流式计算文件摘要
+        
+        Args:
+            file_path: 文件路径
+            hash_factory: 返回哈希对象的构造函数
+            
+        Returns:
+            str: 十六进制摘要
+        """
+        with open(file_path, "rb", buffering=0) as f:
+            # Python 3.11+ 由hashlib在C层直接读取文件完成哈希
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, hash_factory).hexdigest()
+            
+            # 旧版本使用1 MiB的复用缓冲区分块读取，避免每块创建新的bytes对象
+            hasher = hash_factory()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                hasher.update(view[:n])
+        return hasher.hexdigest()
+    
+    def restore_from_backup(self, backup_id: str = None, paths: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         从备份恢复网站文件
         
         Args:
             backup_id: 备份ID，如果为None则使用最近的备份
+            paths: 只恢复指定的相对路径，为None时恢复全部文件
             
         Returns:
             Dict: 恢复结果信息
@@ -430,8 +1134,9 @@ class BackupManager:
                 'error': f"备份文件不存在: {backup_path}"
             }
         
-        # 验证备份文件完整性
-        if not self._verify_backup_integrity(backup_info):
+        # 默认不预先校验整个备份：各条目在流式解压时由ZipExtFile校验CRC-32，
+        # 部分恢复只校验选中的条目；paranoid_verify开启时仍先校验整个备份文件的哈希
+        if self.paranoid_verify and not self._verify_backup_integrity(backup_info):
             return {
                 'status': 'error',
                 'error': f"备份文件完整性验证失败: {backup_path}"
@@ -448,66 +1153,62 @@ class BackupManager:
                 'error_files': 0
             }
             
-            # 创建临时目录用于解压
-            temp_dir = os.path.join(self.backup_dir, f"temp_restore_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            os.makedirs(temp_dir, exist_ok=True)
-            
-            try:
-                # 解压备份文件到临时目录
-                with zipfile.ZipFile(backup_path, 'r') as zipf:
-                    zipf.extractall(temp_dir)
-                
-                # 遍历解压后的文件并恢复
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        temp_file_path = os.path.join(root, file)
-                        
-                        # 计算目标路径
-                        rel_path = os.path.relpath(temp_file_path, temp_dir)
-                        target_path = os.path.join(self.site_path, rel_path)
-                        
+            # 通过mmap访问备份文件，内核只需换入中央目录和实际读取的条目；
+            # 直接从ZIP流式写入目标文件，写文件以IO为主，使用线程池并行恢复各个条目
+            with open(backup_path, 'rb') as f, \
+                    _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    zipfile.ZipFile(mm, 'r') as zipf:
+                if paths is None:
+                    members = [zinfo for zinfo in zipf.infolist() if not zinfo.is_dir()]
+                    advice = getattr(mmap, 'MADV_SEQUENTIAL', None)
+                else:
+                    members = []
+                    for path in paths:
                         try:
-                            # 确保目标目录存在
-                            os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                            
-                            # 复制文件
-                            shutil.copy2(temp_file_path, target_path)
-                            stats['restored_files'] += 1
-                            logger.debug(f"恢复文件: {rel_path}")
-                        except Exception as e:
-                            stats['error_files'] += 1
-                            logger.warning(f"恢复文件失败 {target_path}: {str(e)}")
-                        finally:
+                            members.append(zipf.getinfo(path.replace(os.sep, '/')))
+                        except KeyError:
                             stats['total_files'] += 1
+                            stats['error_files'] += 1
+                            logger.warning(f"备份中不存在文件: {path}")
+                    advice = getattr(mmap, 'MADV_RANDOM', None)
                 
-                # 恢复信息
-                restore_info = {
-                    'backup_id': backup_info['backup_id'],
-                    'restore_time': datetime.datetime.now().strftime("%Y%m%d_%H%M%S"),
-                    'stats': stats,
-                    'duration_seconds': (datetime.datetime.now() - start_time).total_seconds(),
-                    'original_backup_info': backup_info
-                }
-                
-                # 保存恢复记录
-                restore_log_path = os.path.join(self.backup_dir, f"restore_{restore_info['restore_time']}.json")
-                with open(restore_log_path, 'w', encoding='utf-8') as f:
-                    json.dump(restore_info, f, ensure_ascii=False, indent=2)
-                
-                logger.info(f"从备份恢复成功: {backup_info['backup_id']}, 恢复文件数: {stats['restored_files']}")
-                
-                return {
-                    'status': 'success',
-                    'restore_info': restore_info
-                }
-                
-            finally:
-                # 清理临时目录
-                if os.path.exists(temp_dir):
-                    try:
-                        shutil.rmtree(temp_dir)
-                    except Exception as e:
-                        logger.warning(f"清理临时目录失败 {temp_dir}: {str(e)}")
+                # 每个恢复线程使用自己的映射视图读取条目
+                reader = _MemberReader(zipf, f.fileno(), advice)
+                try:
+                    max_workers = min(32, (os.cpu_count() or 1) * 4)
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        for rel_path, target_path, error in executor.map(
+                                functools.partial(self._restore_member, reader), members):
+                            stats['total_files'] += 1
+                            if error is None:
+                                stats['restored_files'] += 1
+                                logger.debug(f"恢复文件: {rel_path}")
+                            else:
+                                stats['error_files'] += 1
+                                logger.warning(f"恢复文件失败 {target_path}: {error}")
+                finally:
+                    reader.close()
+            
+            # 恢复信息
+            restore_info = {
+                'backup_id': backup_info['backup_id'],
+                'restore_time': datetime.datetime.now().strftime("%Y%m%d_%H%M%S"),
+                'paths': paths,
+                'stats': stats,
+                'duration_seconds': (datetime.datetime.now() - start_time).total_seconds(),
+                'original_backup_info': backup_info
+            }
+            
+            # 保存恢复记录
+            restore_log_path = os.path.join(self.backup_dir, f"restore_{restore_info['restore_time']}.json")
+            _atomic_write_bytes(restore_log_path, _json_dumps(restore_info))
+            
+            logger.info(f"从备份恢复成功: {backup_info['backup_id']}, 恢复文件数: {stats['restored_files']}")
+            
+            return {
+                'status': 'success',
+                'restore_info': restore_info
+            }
         
         except Exception as e:
             logger.error(f"从备份恢复失败: {str(e)}")
@@ -516,6 +1217,48 @@ class BackupManager:
                 'error': str(e)
             }
     
+    def _restore_member(self, reader: _MemberReader, zinfo: zipfile.ZipInfo) -> Tuple[str, str, Optional[str]]:
+        """
+        将备份中的单个条目恢复到网站目录，在恢复线程池中执行
+        
+        Args:
+            reader: 备份条目读取器，由各个恢复线程共享
+            zinfo: 要恢复的条目信息
+            
+        Returns:
+            Tuple: (相对路径, 目标路径, 错误信息，成功时为None)
+        """
+        # 计算目标路径
+        rel_path = _member_rel_path(zinfo.filename)
+        target_path = os.path.join(self.site_path, rel_path)
+        
+        try:
+            if not rel_path:
+                raise ValueError(f"无效的备份条目路径: {zinfo.filename}")
+            
+            # 确保目标目录存在
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            
+            # 先写入临时文件，解压完成且CRC校验通过后再替换目标文件，
+            # 条目损坏时不会留下写了一半的网站文件
+            tmp_path = _temp_path_for(target_path)
+            try:
+                with reader.open(zinfo) as src, open(tmp_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                if os.path.exists(target_path):
+                    # 与直接覆盖写入一致，保留原文件的权限
+                    shutil.copymode(target_path, tmp_path)
+                os.replace(tmp_path, target_path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            return rel_path, target_path, None
+        except Exception as e:
+            return rel_path, target_path, str(e)
+    
     def _get_backup_info(self, backup_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         获取备份信息
@@ -526,15 +1269,11 @@ class BackupManager:
         Returns:
             Dict: 备份信息，如果找不到则返回None
         """
-        # 如果提供了backup_id，直接获取
+        # 如果提供了backup_id，直接从索引中查找
         if backup_id:
-            info_file_path = os.path.join(self.backup_dir, f"{backup_id}.json")
-            if os.path.exists(info_file_path):
-                try:
-                    with open(info_file_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                except Exception as e:
-                    logger.error(f"读取备份信息失败 {info_file_path}: {str(e)}")
+            for backup_info in self._load_index()['backups']:
+                if backup_info.get('backup_id') == backup_id:
+                    return dict(backup_info)
         
         # 如果没有提供backup_id或找不到指定的备份，获取最近的备份
         return self.get_latest_backup_info()
@@ -546,29 +1285,79 @@ class BackupManager:
         Returns:
             Dict: 最近的备份信息，如果没有备份则返回None
         """
-        # 从备份目录中查找所有备份信息文件
-        backup_info_files = []
-        for file in os.listdir(self.backup_dir):
-            if file.endswith('.json') and file.startswith('backup_'):
-                backup_info_files.append(os.path.join(self.backup_dir, file))
+        # 索引按创建顺序保存，最后一项即为最新备份
+        backups = self._load_index()['backups']
+        return dict(backups[-1]) if backups else None
+    
+    def _load_index(self) -> Dict[str, Any]:
+        """
+        加载备份索引，index.json不存在或损坏时根据各备份信息文件重建
+        
+        缓存的索引只在index.json未被改动时复用，其他实例或进程写入的备份不会被覆盖丢失。
+        修改索引前都应重新调用本方法获取最新内容。
         
-        # 按文件名排序（基于时间戳）
-        backup_info_files.sort(reverse=True)
+        Returns:
+            Dict: 备份索引，'backups'为按时间正序排列的备份信息列表
+        """
+        sig = self._index_file_sig()
+        if self._index is not None and sig is not None and sig == self._index_sig:
+            return self._index
         
-        # 读取最新的备份信息
-        if backup_info_files:
+        if sig is not None:
             try:
-                with open(backup_info_files[0], 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                index = _json_load_file(self._index_path)
+                if isinstance(index, dict) and isinstance(index.get('backups'), list):
+                    self._index = index
+                    self._index_sig = sig
+                    return index
+                logger.warning(f"备份索引格式无效，重新生成: {self._index_path}")
             except Exception as e:
-                logger.error(f"读取最新备份信息失败: {str(e)}")
+                logger.warning(f"读取备份索引失败，重新生成 {self._index_path}: {str(e)}")
         
-        return None
+        # 从备份信息文件重建索引
+        backups = []
+        for file in os.listdir(self.backup_dir):
+            if file.endswith('.json') and file.startswith('backup_'):
+                info_file_path = os.path.join(self.backup_dir, file)
+                try:
+                    backups.append(_json_load_file(info_file_path))
+                except Exception as e:
+                    logger.error(f"读取备份信息失败 {info_file_path}: {str(e)}")
+        backups.sort(key=lambda x: x.get('timestamp', ''))
+        
+        self._index = {'backups': backups}
+        self._save_index()
+        return self._index
+    
+    def _index_file_sig(self) -> Optional[Tuple[int, int, int]]:
+        """
+        获取index.json的文件状态，用于判断缓存的索引是否过期
+        
+        Returns:
+            Tuple: (inode, 修改时间ns, 大小)，文件不存在时返回None
+        """
+        try:
+            st = os.stat(self._index_path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+    
+    def _save_index(self):
+        """保存备份索引，先写入临时文件再替换，避免中途失败留下不完整的索引"""
+        try:
+            _atomic_write_bytes(self._index_path, _json_dumps(self._index))
+            self._index_sig = self._index_file_sig()
+        except Exception as e:
+            self._index_sig = None
+            logger.error(f"保存备份索引失败 {self._index_path}: {str(e)}")
     
     def _verify_backup_integrity(self, backup_info: Dict[str, Any]) -> bool:
         """
         验证备份文件的完整性
         
+        默认使用ZIP中央目录记录的CRC-32逐条目校验（zlib.crc32有硬件加速），
+        paranoid_verify开启时改为校验整个备份文件的哈希。
+        
         Args:
             backup_info: 备份信息
             
@@ -576,18 +1365,40 @@ class BackupManager:
             bool: 如果备份文件完整则返回True
         """
         backup_path = backup_info['backup_path']
-        expected_md5 = backup_info.get('backup_md5', '')
         
-        if not expected_md5:
-            logger.warning("备份信息中没有MD5值，跳过完整性验证")
+        if not self.paranoid_verify:
+            try:
+                with zipfile.ZipFile(backup_path, 'r') as zipf:
+                    bad_member = zipf.testzip()
+                if bad_member is None:
+                    return True
+                logger.error(f"备份文件条目CRC校验失败: {bad_member}")
+                return False
+            except Exception as e:
+                logger.error(f"验证备份完整性失败: {str(e)}")
+                return False
+        
+        # 兼容旧版本只记录了backup_md5的备份信息
+        expected_hash = backup_info.get('backup_hash', '')
+        algo = backup_info.get('backup_hash_algo', 'blake2b')
+        if not expected_hash:
+            expected_hash = backup_info.get('backup_md5', '')
+            algo = 'md5'
+        
+        if not expected_hash:
+            logger.warning("备份信息中没有哈希值，跳过完整性验证")
+            return True
+        
+        if self._resolve_hash_algo(algo) != algo:
+            logger.warning(f"当前环境不支持哈希算法 {algo}，跳过完整性验证")
             return True
         
         try:
-            actual_md5 = self._calculate_file_md5(backup_path)
-            if actual_md5 == expected_md5:
+            actual_hash = self._calculate_file_hash(backup_path, algo)
+            if actual_hash == expected_hash:
                 return True
             else:
-                logger.error(f"备份文件MD5不匹配。期望: {expected_md5}, 实际: {actual_md5}")
+                logger.error(f"备份文件哈希不匹配({algo})。期望: {expected_hash}, 实际: {actual_hash}")
                 return False
         except Exception as e:
             logger.error(f"验证备份完整性失败: {str(e)}")
@@ -597,41 +1408,35 @@ class BackupManager:
         """
         清理旧备份文件，保留指定数量的最新备份
         """
-        # 获取要保留的备份数量
-        keep_count = self.backup_config.get('keep_backups', 5)
-        
+        keep_count = self._keep_backups
         if keep_count <= 0:
             return
         
-        # 获取所有备份信息文件
-        backup_info_files = []
-        backup_files = []
-        
-        for file in os.listdir(self.backup_dir):
-            full_path = os.path.join(self.backup_dir, file)
-            if file.endswith('.json') and file.startswith('backup_'):
-                backup_info_files.append(full_path)
-            elif file.endswith('.zip') and file.startswith('backup_'):
-                backup_files.append(full_path)
-        
-        # 按文件名排序（基于时间戳）
-        backup_info_files.sort(reverse=True)
-        backup_files.sort(reverse=True)
+        # 索引按时间正序排列，超过保留数量的旧备份位于列表前部
+        index = self._load_index()
+        old_backups = index['backups'][:-keep_count]
+        if not old_backups:
+            return
         
         # 删除超过保留数量的旧备份
-        for info_file in backup_info_files[keep_count:]:
-            try:
-                os.remove(info_file)
-                logger.info(f"删除旧备份信息: {info_file}")
-            except Exception as e:
-                logger.error(f"删除旧备份信息失败 {info_file}: {str(e)}")
+        for backup_info in old_backups:
+            backup_id = backup_info.get('backup_id', '')
+            old_files = [
+                (os.path.join(self.backup_dir, f"{backup_id}.json"), '备份信息'),
+                (os.path.join(self.backup_dir, f"{backup_id}.zip"), '备份文件'),
+                (os.path.join(self.backup_dir, f"manifest_{backup_id}.json"), '备份文件清单'),
+            ]
+            for file_path, label in old_files:
+                if not os.path.exists(file_path):
+                    continue
+                try:
+                    os.remove(file_path)
+                    logger.info(f"删除旧{label}: {file_path}")
+                except Exception as e:
+                    logger.error(f"删除旧{label}失败 {file_path}: {str(e)}")
         
-        for backup_file in backup_files[keep_count:]:
-            try:
-                os.remove(backup_file)
-                logger.info(f"删除旧备份文件: {backup_file}")
-            except Exception as e:
-                logger.error(f"删除旧备份文件失败 {backup_file}: {str(e)}")
+        index['backups'] = index['backups'][-keep_count:]
+        self._save_index()
     
     def list_backups(self) -> List[Dict[str, Any]]:
         """
@@ -642,25 +1447,14 @@ class BackupManager:
         """
         backups = []
         
-        # 获取所有备份信息文件
-        for file in os.listdir(self.backup_dir):
-            if file.endswith('.json') and file.startswith('backup_'):
-                info_file_path = os.path.join(self.backup_dir, file)
-                
-                try:
-                    with open(info_file_path, 'r', encoding='utf-8') as f:
-                        backup_info = json.load(f)
-                    
-                    # 检查备份文件是否存在
-                    backup_path = backup_info['backup_path']
-                    backup_info['backup_exists'] = os.path.exists(backup_path)
-                    
-                    backups.append(backup_info)
-                except Exception as e:
-                    logger.error(f"读取备份信息失败 {info_file_path}: {str(e)}")
-        
-        # 按时间戳排序
-        backups.sort(key=lambda x: x['timestamp'], reverse=True)
+        # 从索引获取备份信息，按时间倒序返回
+        for backup_info in reversed(self._load_index()['backups']):
+            backup_info = dict(backup_info)
+            
+            # 检查备份文件是否存在
+            backup_info['backup_exists'] = os.path.exists(backup_info.get('backup_path', ''))
+            
+            backups.append(backup_info)
         
         return backups
     
@@ -678,6 +1472,7 @@ class BackupManager:
         
         info_file_path = os.path.join(self.backup_dir, f"{backup_id}.json")
         backup_path = os.path.join(self.backup_dir, f"{backup_id}.zip")
+        manifest_path = os.path.join(self.backup_dir, f"manifest_{backup_id}.json")
         
         deleted_files = []
         errors = []
@@ -698,6 +1493,21 @@ class BackupManager:
             except Exception as e:
                 errors.append(f"删除备份文件失败: {str(e)}")
         
+        # 删除增量备份使用的文件清单
+        if os.path.exists(manifest_path):
+            try:
+                os.remove(manifest_path)
+                deleted_files.append(manifest_path)
+            except Exception as e:
+                errors.append(f"删除备份文件清单失败: {str(e)}")
+        
+        # 从索引中移除
+        index = self._load_index()
+        remaining = [b for b in index['backups'] if b.get('backup_id') != backup_id]
+        if len(remaining) != len(index['backups']):
+            index['backups'] = remaining
+            self._save_index()
+        
         if errors:
             return {
                 'status': 'partial',
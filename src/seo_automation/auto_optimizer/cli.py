@@ -4,56 +4,286 @@ import os
 import sys
 import argparse
 import logging
+import io
+import gzip
 import json
-import datetime
+import copy
+import time
+import functools
+import pickle
+import itertools
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
-# 添加项目根目录到Python路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from src.seo_automation.auto_optimizer.config_manager import ConfigManager
-from src.seo_automation.auto_optimizer.profile_manager import ProfileManager
-from src.seo_automation.auto_optimizer.optimizer import SEOAutoOptimizer
-from src.seo_automation.auto_optimizer.backup_manager import BackupManager
+# 项目目录、日志目录和默认备份目录，只在导入时计算一次
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_LOG_DIR = os.path.join(_PROJECT_ROOT, 'logs')
+_DEFAULT_BACKUP_DIR = os.path.join(_PROJECT_ROOT, 'backups')
 
-# 配置日志
+# 配置文件列表的持久缓存，跨进程复用，避免每次启动都重新解析所有配置文件
+_PROFILES_PICKLE = os.path.join(os.path.expanduser('~'), '.cache', 'seo_auto_optimizer', 'profiles.pkl')
+
+# 配置文件数量达到该值时才使用线程池并行读取，文件较少时线程池的开销得不偿失
+PARALLEL_PROFILE_MIN_FILES = 8
+
+# 保存JSON文件时使用的写缓冲区大小，减少json.dump增量写出时的系统调用次数
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# 未安装orjson时复用的JSON编码器；报告结构由程序生成，不存在循环引用，无需检查
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, check_circular=False, separators=(',', ': '))
+
+# 输出路径以该后缀结尾时用gzip压缩保存；级别1的压缩率已接近默认级别9，速度却快得多
+_GZIP_SUFFIX = '.gz'
+_GZIP_COMPRESS_LEVEL = 1
+
+# 时间戳格式：_TS_FMT用于备份名称，_DATETIME_FMT用于配置和报告中的时间字段
+_TS_FMT = '%Y%m%d_%H%M%S'
+_DATETIME_FMT = '%Y-%m-%d %H:%M:%S'
+
+# 需要写入日志文件的命令；version、config和--help只输出到终端，不创建日志文件
+_FILE_LOGGING_COMMANDS = frozenset(['profile', 'analyze', 'recommend', 'optimize', 'backup'])
+
+# 判定网站目录时识别的 HTML 文件后缀
+_HTML_SUFFIXES = ('.html', '.htm')
+
+# 问题严重程度和建议优先级的显示顺序
+_SEVERITY_ORDER = ('critical', 'high', 'medium', 'low')
+_PRIORITY_ORDER = ('high', 'medium', 'low')
+
+# 配置文件列表的表头，各列宽度依次为20、30、15、20、20
+_PROFILE_LIST_HEADER = ' '.join(("名称".ljust(20), "网站路径".ljust(30), "优化级别".ljust(15),
+                                 "创建时间".ljust(20), "更新时间".ljust(20)))
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 配置日志，文件日志在执行需要它的命令时才安装
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
-        logging.FileHandler(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'logs', 'seo_auto_optimizer.log')),
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+_file_handler = None
 
-class CLI:
-    """SEO自优化程序的命令行界面"""
+
+def _install_file_logging():
+    """为根日志记录器添加文件处理器，重复调用时不会重复添加"""
+    global _file_handler
+    if _file_handler is not None:
+        return
     
-    def __init__(self):
-        """初始化CLI"""
-        self.config_manager = ConfigManager()
-        self.profile_manager = ProfileManager(self.config_manager)
-        self.optimizer = None
-        
-        # 确保日志目录存在
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'logs')
-        os.makedirs(log_dir, exist_ok=True)
+    # 确保日志目录存在
+    os.makedirs(_LOG_DIR, exist_ok=True)
+    _file_handler = logging.FileHandler(os.path.join(_LOG_DIR, 'seo_auto_optimizer.log'))
+    _file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    logging.getLogger().addHandler(_file_handler)
+
+
+def _ensure_project_path():
+    """添加项目根目录到Python路径，只在需要加载项目模块的命令中调用"""
+    if _PROJECT_ROOT not in sys.path:
+        sys.path.append(_PROJECT_ROOT)
+
+
+def _load_profiles_pickle(profiles_dir: str, signature: tuple) -> Optional[List[Dict[str, Any]]]:
+    """
+    从持久缓存读取配置文件列表
     
-    def parse_args(self):
-        """
-        解析命令行参数
-        
-        Returns:
-            argparse.Namespace: 解析后的参数
-        """
-        parser = argparse.ArgumentParser(
-            prog='seo_auto_optimizer',
-            description='SEO自优化程序 - 自动分析和优化网站SEO，提升搜索引擎排名',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
+    Args:
+        profiles_dir: 配置文件目录
+        signature: 配置文件目录签名
+        
+    Returns:
+        List: 缓存的配置文件列表，缓存不存在或已失效时返回None
+    """
+    try:
+        with open(_PROFILES_PICKLE, 'rb') as f:
+            cached_dir, cached_signature, profiles = pickle.load(f)
+    except Exception:
+        return None
+    
+    if cached_dir != profiles_dir or cached_signature != signature:
+        return None
+    return profiles
+
+
+def _save_profiles_pickle(profiles_dir: str, signature: tuple, profiles: List[Dict[str, Any]]):
+    """
+    将配置文件列表写入持久缓存，先写临时文件再替换，避免并发读取到不完整的内容
+    
+    Args:
+        profiles_dir: 配置文件目录
+        signature: 配置文件目录签名
+        profiles: 配置文件列表
+    """
+    temp_path = f"{_PROFILES_PICKLE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_PROFILES_PICKLE), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump((profiles_dir, signature, profiles), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, _PROFILES_PICKLE)
+    except Exception as e:
+        logger.debug(f"写入配置文件列表缓存失败: {str(e)}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def _orjson_indented(obj: Any, level: int) -> bytes:
+    """
+    用orjson序列化对象，并将换行后的缩进整体右移level层，用于嵌入到外层文档中
+    
+    JSON字符串中的换行符总是被转义，输出中的换行字节只会是格式化产生的。
+    
+    Args:
+        obj: 要序列化的对象
+        level: 嵌套层级
+        
+    Returns:
+        bytes: 缩进后的JSON字节串
+    """
+    data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return data.replace(b'\n', b'\n' + b'  ' * level) if level else data
+
+
+def _open_output(output_path: str):
+    """
+    以带缓冲的二进制写模式打开输出文件，路径以.gz结尾时写入gzip压缩流
+    
+    Args:
+        output_path: 输出文件路径
+        
+    Returns:
+        二进制文件对象
+    """
+    if output_path.endswith(_GZIP_SUFFIX):
+        return io.BufferedWriter(gzip.GzipFile(output_path, 'wb', compresslevel=_GZIP_COMPRESS_LEVEL),
+                                 buffer_size=_WRITE_BUFFER_SIZE)
+    return open(output_path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+
+
+def _write_bytes(output_path: str, data: bytes):
+    """
+    直接通过文件描述符写入字节数据，不经过Python的缓冲层
+    
+    Args:
+        output_path: 输出文件路径
+        data: 要写入的数据
+    """
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_json(obj: Any, output_path: str, stream_key: Optional[str] = None):
+    """
+    将对象以缩进两格的JSON格式写入文件，优先使用orjson；路径以.gz结尾时压缩保存
+    
+    Args:
+        obj: 要保存的对象
+        output_path: 输出文件路径
+        stream_key: 顶层字典中需要逐项序列化的列表键，避免一次生成整个文档；
+            标准库编码器本身就是增量写出的，只对orjson生效
+    """
+    if orjson is not None and stream_key is not None:
+        with _open_output(output_path) as f:
+            separator = b'{'
+            for key, value in obj.items():
+                f.write(separator + b'\n  ' + orjson.dumps(key) + b': ')
+                separator = b','
+                if key == stream_key and value:
+                    item_separator = b'['
+                    for item in value:
+                        f.write(item_separator + b'\n    ' + _orjson_indented(item, 2))
+                        item_separator = b','
+                    f.write(b'\n  ]')
+                else:
+                    f.write(_orjson_indented(value, 1))
+            f.write(b'\n}' if obj else b'{}')
+    elif orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        if output_path.endswith(_GZIP_SUFFIX):
+            with _open_output(output_path) as f:
+                f.write(data)
+        else:
+            _write_bytes(output_path, data)
+    else:
+        with io.TextIOWrapper(_open_output(output_path), encoding='utf-8') as f:
+            for chunk in _JSON_ENCODER.iterencode(obj):
+                f.write(chunk)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_name(name: str) -> str:
+    """
+    格式化类别名称或修改类型名称，结果按名称缓存
+    
+    Args:
+        name: 以下划线分隔的名称
+        
+    Returns:
+        str: 格式化后的名称
+    """
+    # 将下划线替换为空格，并将首字母大写
+    return ' '.join(word.capitalize() for word in name.split('_'))
+
+
+def _trunc(s: str, n: int) -> str:
+    """
+    将字符串截断到指定宽度，超出部分以'..'结尾
+    
+    Args:
+        s: 原字符串
+        n: 最大宽度
+        
+    Returns:
+        截断后的字符串
+    """
+    return s if len(s) <= n else s[:n - 2] + '..'
+
+
+def _has_html(path: str) -> bool:
+    """
+    检查目录下是否直接包含 HTML 文件，找到第一个即返回
+    
+    Args:
+        path: 目录路径
+        
+    Returns:
+        是否包含 HTML 文件
+    """
+    with os.scandir(path) as it:
+        return any(entry.name.endswith(_HTML_SUFFIXES) for entry in it)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    构建命令行参数解析器，只构建一次，之后复用
+    
+    Returns:
+        argparse.ArgumentParser: 参数解析器
+    """
+    parser = argparse.ArgumentParser(
+        prog='seo_auto_optimizer',
+        description='SEO自优化程序 - 自动分析和优化网站SEO，提升搜索引擎排名',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
 示例:
   # 创建新配置文件
   seo_auto_optimizer profile create --name "my_website" --site-path "/path/to/website" --description "我的网站SEO配置"
@@ -75,98 +305,269 @@ class CLI:
   
   # 恢复备份
   seo_auto_optimizer backup restore --name "backup_20230501_120000"
-            """
-        )
-        
-        # 创建子命令解析器
-        subparsers = parser.add_subparsers(dest='command', help='命令')
-        
-        # profile 命令 - 配置文件管理
-        profile_parser = subparsers.add_parser('profile', help='管理配置文件')
-        profile_subparsers = profile_parser.add_subparsers(dest='profile_command', help='配置文件操作')
-        
-        # profile create - 创建新配置文件
-        profile_create = profile_subparsers.add_parser('create', help='创建新配置文件')
-        profile_create.add_argument('--name', required=True, help='配置文件名称')
-        profile_create.add_argument('--site-path', required=True, help='网站根目录路径')
-        profile_create.add_argument('--description', default='', help='配置文件描述')
-        
-        # profile list - 列出所有配置文件
-        profile_list = profile_subparsers.add_parser('list', help='列出所有配置文件')
-        
-        # profile load - 加载配置文件
-        profile_load = profile_subparsers.add_parser('load', help='加载配置文件')
-        profile_load.add_argument('--name', required=True, help='配置文件名称')
-        
-        # profile delete - 删除配置文件
-        profile_delete = profile_subparsers.add_parser('delete', help='删除配置文件')
-        profile_delete.add_argument('--name', required=True, help='配置文件名称')
-        
-        # profile export - 导出配置文件
-        profile_export = profile_subparsers.add_parser('export', help='导出配置文件')
-        profile_export.add_argument('--name', required=True, help='配置文件名称')
-        profile_export.add_argument('--output', required=True, help='导出路径')
-        
-        # profile import - 导入配置文件
-        profile_import = profile_subparsers.add_parser('import', help='导入配置文件')
-        profile_import.add_argument('--file', required=True, help='导入文件路径')
-        profile_import.add_argument('--name', help='新的配置文件名称')
-        
-        # profile update-path - 更新网站路径
-        profile_update_path = profile_subparsers.add_parser('update-path', help='更新配置文件中的网站路径')
-        profile_update_path.add_argument('--name', required=True, help='配置文件名称')
-        profile_update_path.add_argument('--new-path', required=True, help='新的网站路径')
-        
-        # analyze 命令 - SEO分析
-        analyze_parser = subparsers.add_parser('analyze', help='执行SEO分析')
-        analyze_parser.add_argument('--profile', required=True, help='配置文件名称')
-        analyze_parser.add_argument('--output', help='分析结果输出路径')
-        analyze_parser.add_argument('--verbose', action='store_true', help='显示详细分析结果')
-        
-        # recommend 命令 - 生成优化建议
-        recommend_parser = subparsers.add_parser('recommend', help='生成优化建议')
-        recommend_parser.add_argument('--profile', required=True, help='配置文件名称')
-        recommend_parser.add_argument('--output', help='优化建议输出路径')
-        recommend_parser.add_argument('--level', choices=['basic', 'moderate', 'advanced'], help='优化级别')
-        
-        # optimize 命令 - 执行优化
-        optimize_parser = subparsers.add_parser('optimize', help='执行SEO优化')
-        optimize_parser.add_argument('--profile', required=True, help='配置文件名称')
-        optimize_parser.add_argument('--dry-run', action='store_true', help='只显示将要进行的更改，不实际修改文件')
-        optimize_parser.add_argument('--backup', action='store_true', help='优化前创建备份（默认开启）')
-        optimize_parser.add_argument('--no-backup', action='store_true', help='优化前不创建备份')
-        optimize_parser.add_argument('--output', help='优化报告输出路径')
-        
-        # backup 命令 - 备份管理
-        backup_parser = subparsers.add_parser('backup', help='管理备份')
-        backup_subparsers = backup_parser.add_subparsers(dest='backup_command', help='备份操作')
-        
-        # backup list - 列出所有备份
-        backup_list = backup_subparsers.add_parser('list', help='列出所有备份')
-        
-        # backup create - 创建新备份
-        backup_create = backup_subparsers.add_parser('create', help='创建新备份')
-        backup_create.add_argument('--profile', required=True, help='配置文件名称')
-        backup_create.add_argument('--name', help='备份名称')
-        
-        # backup restore - 恢复备份
-        backup_restore = backup_subparsers.add_parser('restore', help='恢复备份')
-        backup_restore.add_argument('--name', required=True, help='备份名称')
-        backup_restore.add_argument('--confirm', action='store_true', help='确认恢复备份（需要此参数以防止误操作）')
-        
-        # backup delete - 删除备份
-        backup_delete = backup_subparsers.add_parser('delete', help='删除备份')
-        backup_delete.add_argument('--name', required=True, help='备份名称')
-        backup_delete.add_argument('--confirm', action='store_true', help='确认删除备份（需要此参数以防止误操作）')
-        
-        # config 命令 - 配置管理
-        config_parser = subparsers.add_parser('config', help='管理程序配置')
-        config_parser.add_argument('--show', action='store_true', help='显示当前配置')
-        
-        # 版本命令
-        version_parser = subparsers.add_parser('version', help='显示程序版本')
-        
-        return parser.parse_args()
+        """
+    )
+    
+    # 创建子命令解析器
+    subparsers = parser.add_subparsers(dest='command', help='命令')
+    
+    # profile 命令 - 配置文件管理
+    profile_parser = subparsers.add_parser('profile', help='管理配置文件')
+    profile_subparsers = profile_parser.add_subparsers(dest='profile_command', help='配置文件操作')
+    
+    # profile create - 创建新配置文件
+    profile_create = profile_subparsers.add_parser('create', help='创建新配置文件')
+    profile_create.add_argument('--name', required=True, help='配置文件名称')
+    profile_create.add_argument('--site-path', required=True, help='网站根目录路径')
+    profile_create.add_argument('--description', default='', help='配置文件描述')
+    
+    # profile list - 列出所有配置文件
+    profile_list = profile_subparsers.add_parser('list', help='列出所有配置文件')
+    
+    # profile load - 加载配置文件
+    profile_load = profile_subparsers.add_parser('load', help='加载配置文件')
+    profile_load.add_argument('--name', required=True, help='配置文件名称')
+    
+    # profile delete - 删除配置文件
+    profile_delete = profile_subparsers.add_parser('delete', help='删除配置文件')
+    profile_delete.add_argument('--name', required=True, help='配置文件名称')
+    
+    # profile export - 导出配置文件
+    profile_export = profile_subparsers.add_parser('export', help='导出配置文件')
+    profile_export.add_argument('--name', required=True, help='配置文件名称')
+    profile_export.add_argument('--output', required=True, help='导出路径')
+    
+    # profile import - 导入配置文件
+    profile_import = profile_subparsers.add_parser('import', help='导入配置文件')
+    profile_import.add_argument('--file', required=True, help='导入文件路径')
+    profile_import.add_argument('--name', help='新的配置文件名称')
+    
+    # profile update-path - 更新网站路径
+    profile_update_path = profile_subparsers.add_parser('update-path', help='更新配置文件中的网站路径')
+    profile_update_path.add_argument('--name', required=True, help='配置文件名称')
+    profile_update_path.add_argument('--new-path', required=True, help='新的网站路径')
+    
+    # analyze 命令 - SEO分析
+    analyze_parser = subparsers.add_parser('analyze', help='执行SEO分析')
+    analyze_parser.add_argument('--profile', required=True, help='配置文件名称')
+    analyze_parser.add_argument('--output', help='分析结果输出路径（以.gz结尾时压缩保存）')
+    analyze_parser.add_argument('--verbose', action='store_true', help='显示详细分析结果')
+    
+    # recommend 命令 - 生成优化建议
+    recommend_parser = subparsers.add_parser('recommend', help='生成优化建议')
+    recommend_parser.add_argument('--profile', required=True, help='配置文件名称')
+    recommend_parser.add_argument('--output', help='优化建议输出路径（以.gz结尾时压缩保存）')
+    recommend_parser.add_argument('--level', choices=['basic', 'moderate', 'advanced'], help='优化级别')
+    
+    # optimize 命令 - 执行优化
+    optimize_parser = subparsers.add_parser('optimize', help='执行SEO优化')
+    optimize_parser.add_argument('--profile', required=True, help='配置文件名称')
+    optimize_parser.add_argument('--dry-run', action='store_true', help='只显示将要进行的更改，不实际修改文件')
+    optimize_parser.add_argument('--backup', action='store_true', help='优化前创建备份（默认开启）')
+    optimize_parser.add_argument('--no-backup', action='store_true', help='优化前不创建备份')
+    optimize_parser.add_argument('--output', help='优化报告输出路径（以.gz结尾时压缩保存）')
+    
+    # backup 命令 - 备份管理
+    backup_parser = subparsers.add_parser('backup', help='管理备份')
+    backup_subparsers = backup_parser.add_subparsers(dest='backup_command', help='备份操作')
+    
+    # backup list - 列出所有备份
+    backup_list = backup_subparsers.add_parser('list', help='列出所有备份')
+    
+    # backup create - 创建新备份
+    backup_create = backup_subparsers.add_parser('create', help='创建新备份')
+    backup_create.add_argument('--profile', required=True, help='配置文件名称')
+    backup_create.add_argument('--name', help='备份名称')
+    
+    # backup restore - 恢复备份
+    backup_restore = backup_subparsers.add_parser('restore', help='恢复备份')
+    backup_restore.add_argument('--name', required=True, help='备份名称')
+    backup_restore.add_argument('--confirm', action='store_true', help='确认恢复备份（需要此参数以防止误操作）')
+    
+    # backup delete - 删除备份
+    backup_delete = backup_subparsers.add_parser('delete', help='删除备份')
+    backup_delete.add_argument('--name', required=True, help='备份名称')
+    backup_delete.add_argument('--confirm', action='store_true', help='确认删除备份（需要此参数以防止误操作）')
+    
+    # config 命令 - 配置管理
+    config_parser = subparsers.add_parser('config', help='管理程序配置')
+    config_parser.add_argument('--show', action='store_true', help='显示当前配置')
+    
+    # 版本命令
+    version_parser = subparsers.add_parser('version', help='显示程序版本')
+    
+    return parser
+
+
+class CLI:
+    """SEO自优化程序的命令行界面"""
+    
+    def __init__(self):
+        """初始化CLI"""
+        # 配置管理器和配置文件管理器在首次使用时才创建，version、--help等命令无需加载
+        self._config_manager = None
+        self._profile_manager = None
+        self.optimizer = None
+        
+        # 已加载的配置文件：名称 -> (文件路径, 修改时间ns, 配置内容)
+        self._profile_cache = {}
+        # 配置文件列表缓存：(配置文件目录签名, 配置文件列表)
+        self._profiles_cache = None
+        # 本次运行的时间戳，同一命令中保存的多个文件共用
+        self._run_stamp = None
+        
+        # 命令名称 -> 处理方法
+        self._dispatch = {
+            'profile': self.handle_profile_command,
+            'analyze': self.handle_analyze_command,
+            'recommend': self.handle_recommend_command,
+            'optimize': self.handle_optimize_command,
+            'backup': self.handle_backup_command,
+            'config': self.handle_config_command,
+            'version': lambda args: self.show_version()
+        }
+    
+    @property
+    def config_manager(self):
+        """配置管理器，首次访问时创建"""
+        if self._config_manager is None:
+            from src.seo_automation.auto_optimizer.config_manager import ConfigManager
+            self._config_manager = ConfigManager()
+        return self._config_manager
+    
+    @property
+    def profile_manager(self):
+        """配置文件管理器，首次访问时创建"""
+        if self._profile_manager is None:
+            from src.seo_automation.auto_optimizer.profile_manager import ProfileManager
+            self._profile_manager = ProfileManager(self.config_manager)
+        return self._profile_manager
+    
+    def _now_stamp(self) -> str:
+        """
+        获取本次运行的时间戳，首次调用时生成
+        
+        Returns:
+            str: 格式为_DATETIME_FMT的时间戳
+        """
+        if self._run_stamp is None:
+            self._run_stamp = time.strftime(_DATETIME_FMT)
+        return self._run_stamp
+    
+    def _cfg(self, name: str) -> Any:
+        """
+        直接从配置管理器当前的配置字典中读取顶层配置节，不经过点号路径解析
+        
+        Args:
+            name: 配置节名称
+            
+        Returns:
+            Any: 配置值，不存在时返回空字典
+        """
+        return self.config_manager.get_all_config().get(name) or {}
+    
+    def _load_profile_cached(self, profile_name: str) -> Dict[str, Any]:
+        """
+        加载配置文件，文件未修改时复用已解析和验证过的内容
+        
+        Args:
+            profile_name: 配置文件名称
+            
+        Returns:
+            Dict: 加载结果，与ProfileManager.load_profile一致
+        """
+        cached = self._profile_cache.get(profile_name)
+        if cached is not None:
+            profile_path, mtime_ns, profile_content = cached
+            try:
+                unchanged = os.stat(profile_path).st_mtime_ns == mtime_ns
+            except OSError:
+                unchanged = False
+            if unchanged:
+                # 配置内容会被配置管理器引用并修改，每次返回副本
+                profile_content = copy.deepcopy(profile_content)
+                self.profile_manager.apply_profile(profile_name, profile_content)
+                logger.debug(f"使用缓存的配置文件: {profile_name}")
+                return {
+                    'status': 'success',
+                    'profile_name': profile_name,
+                    'profile_path': profile_path,
+                    'profile_content': profile_content
+                }
+        
+        result = self.profile_manager.load_profile(profile_name)
+        if result['status'] == 'success':
+            try:
+                mtime_ns = os.stat(result['profile_path']).st_mtime_ns
+                self._profile_cache[profile_name] = (result['profile_path'], mtime_ns,
+                                                     copy.deepcopy(result['profile_content']))
+            except OSError:
+                self._profile_cache.pop(profile_name, None)
+        return result
+    
+    def _list_profiles_cached(self) -> List[Dict[str, Any]]:
+        """
+        列出所有配置文件，配置文件目录未变化时复用上次的结果
+        
+        目录的修改时间只反映文件的增删，原地修改配置文件不会改变它，
+        因此签名同时包含目录中各个JSON文件的修改时间，只需stat而无需解析文件。
+        结果同时保存到用户缓存目录，下次启动时签名一致即可直接读取。
+        
+        Returns:
+            List: 配置文件信息列表
+        """
+        profiles_dir = self.profile_manager.profiles_dir
+        try:
+            with os.scandir(profiles_dir) as it:
+                file_stats = sorted(
+                    (entry.name, entry.stat().st_mtime_ns) for entry in it if entry.name.endswith('.json'))
+            signature = (os.stat(profiles_dir).st_mtime_ns,) + tuple(file_stats)
+        except OSError:
+            return self.profile_manager.list_profiles()
+        
+        if self._profiles_cache is None or self._profiles_cache[0] != signature:
+            profiles = _load_profiles_pickle(profiles_dir, signature)
+            if profiles is None:
+                profiles = self._parallel_list_profiles([name[:-5] for name, _ in file_stats])
+                _save_profiles_pickle(profiles_dir, signature, profiles)
+            self._profiles_cache = (signature, profiles)
+        return list(self._profiles_cache[1])
+    
+    def _parallel_list_profiles(self, profile_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        读取配置文件信息，配置文件较多时使用线程池并行读取和解析
+        
+        Args:
+            profile_names: 配置文件名称列表
+            
+        Returns:
+            List: 配置文件信息列表，按更新时间倒序排列
+        """
+        get_profile_info = self.profile_manager.get_profile_info
+        if len(profile_names) < PARALLEL_PROFILE_MIN_FILES:
+            infos = [get_profile_info(name) for name in profile_names]
+        else:
+            with ThreadPoolExecutor() as executor:
+                infos = list(executor.map(get_profile_info, profile_names))
+        
+        profiles = [info for info in infos if info is not None]
+        
+        # 按更新时间排序
+        profiles.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
+        
+        return profiles
+    
+    def parse_args(self, argv: Optional[List[str]] = None):
+        """
+        解析命令行参数
+        
+        Args:
+            argv: 要解析的参数列表，为None时使用sys.argv
+        
+        Returns:
+            argparse.Namespace: 解析后的参数
+        """
+        return _build_parser().parse_args(argv)
     
     def run(self, args):
         """
@@ -175,25 +576,20 @@ class CLI:
         Args:
             args: 命令行参数
         """
+        # version只输出文本，无需修改导入路径或加载任何项目模块
+        if args.command != 'version':
+            _ensure_project_path()
+        if args.command in _FILE_LOGGING_COMMANDS:
+            _install_file_logging()
+        
+        self._run_stamp = None
+        handler = self._dispatch.get(args.command)
+        if handler is None:
+            logger.error("请指定有效的命令。使用 --help 查看可用命令。")
+            return 1
+        
         try:
-            if args.command == 'profile':
-                self.handle_profile_command(args)
-            elif args.command == 'analyze':
-                self.handle_analyze_command(args)
-            elif args.command == 'recommend':
-                self.handle_recommend_command(args)
-            elif args.command == 'optimize':
-                self.handle_optimize_command(args)
-            elif args.command == 'backup':
-                self.handle_backup_command(args)
-            elif args.command == 'config':
-                self.handle_config_command(args)
-            elif args.command == 'version':
-                self.show_version()
-            else:
-                logger.error("请指定有效的命令。使用 --help 查看可用命令。")
-                return 1
-            
+            handler(args)
             return 0
         
         except KeyboardInterrupt:
@@ -224,31 +620,26 @@ class CLI:
                 logger.error(f"创建配置文件失败: {result['error']}")
                 
         elif args.profile_command == 'list':
-            profiles = self.profile_manager.list_profiles()
+            profiles = self._list_profiles_cached()
             
             if not profiles:
                 logger.info("没有找到配置文件。")
                 return
             
-            logger.info("\n可用配置文件列表:\n")
-            logger.info("{:<20} {:<30} {:<15} {:<20} {:<20}".format(
-                "名称", "网站路径", "优化级别", "创建时间", "更新时间"
-            ))
-            logger.info("-" * 120)
-            
+            # 所有行拼接后作为一条日志输出
+            rows = ["\n可用配置文件列表:\n", _PROFILE_LIST_HEADER, "-" * 120]
             for profile in profiles:
-                logger.info("{:<20} {:<30} {:<15} {:<20} {:<20}".format(
-                    profile['profile_name'][:18] + '..' if len(profile['profile_name']) > 20 else profile['profile_name'],
-                    profile['site_path'][:28] + '..' if len(profile['site_path']) > 30 else profile['site_path'],
-                    profile['optimization_level'],
-                    profile['created_at'][:16],
-                    profile['updated_at'][:16]
-                ))
-                
-                if profile['description']:
-                    logger.info(f"  描述: {profile['description']}\n")
-                else:
-                    logger.info("")
+                rows.append(' '.join((
+                    _trunc(profile['profile_name'], 20).ljust(20),
+                    _trunc(profile['site_path'], 30).ljust(30),
+                    str(profile['optimization_level']).ljust(15),
+                    profile['created_at'][:16].ljust(20),
+                    profile['updated_at'][:16].ljust(20)
+                )))
+                description = profile['description']
+                rows.append(f"  描述: {description}\n" if description else "")
+            
+            logger.info('\n'.join(rows))
                     
         elif args.profile_command == 'load':
             result = self.profile_manager.load_profile(args.name)
@@ -309,8 +700,10 @@ class CLI:
         Args:
             args: 命令行参数
         """
+        from src.seo_automation.auto_optimizer.optimizer import SEOAutoOptimizer
+        
         # 加载配置文件
-        load_result = self.profile_manager.load_profile(args.profile)
+        load_result = self._load_profile_cached(args.profile)
         if load_result['status'] != 'success':
             logger.error(f"加载配置文件失败: {load_result['error']}")
             return
@@ -340,8 +733,10 @@ class CLI:
         Args:
             args: 命令行参数
         """
+        from src.seo_automation.auto_optimizer.optimizer import SEOAutoOptimizer
+        
         # 加载配置文件
-        load_result = self.profile_manager.load_profile(args.profile)
+        load_result = self._load_profile_cached(args.profile)
         if load_result['status'] != 'success':
             logger.error(f"加载配置文件失败: {load_result['error']}")
             return
@@ -349,7 +744,7 @@ class CLI:
         # 如果指定了优化级别，更新配置
         if args.level:
             # 获取当前优化配置
-            current_config = self.config_manager.get_config('optimization_config') or {}
+            current_config = self._cfg('optimization_config')
             current_config['optimization_level'] = args.level
             self.config_manager.set_config('optimization_config', current_config)
         
@@ -381,16 +776,18 @@ class CLI:
         Returns:
             int: 退出码，成功返回0，失败返回1
         """
+        from src.seo_automation.auto_optimizer.optimizer import SEOAutoOptimizer
+        
         try:
             # 特殊处理：如果提供的是网站目录（包含HTML文件），则创建临时配置
-            if os.path.isdir(args.profile) and any(file.endswith(('.html', '.htm')) for file in os.listdir(args.profile)):
+            if os.path.isdir(args.profile) and _has_html(args.profile):
                 logger.info(f"检测到网站目录: {args.profile}，将其作为网站根目录进行优化")
                 
                 # 创建临时配置
                 temp_profile = {
                     'profile_name': 'temp_website_profile',
                     'site_path': args.profile,
-                    'created_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'created_at': self._now_stamp(),
                     'analysis_config': {
                         'analyze_content': True,
                         'analyze_keywords': True,
@@ -402,16 +799,15 @@ class CLI:
                     }
                 }
                 
-                # 更新配置管理器
+                # 优化器初始化时会把临时配置中的分析和优化配置写入配置管理器，
+                # 这里只需提前设置网站路径，备份管理器在此之前创建并读取它
                 self.config_manager.set_config('site_path', args.profile)
-                self.config_manager.set_config('analysis_config', temp_profile['analysis_config'])
-                self.config_manager.set_config('optimization_config', temp_profile['optimization_config'])
                 
                 # 初始化SEO自优化器
                 self.optimizer = SEOAutoOptimizer(self.config_manager, temp_profile)
                 
                 # 确定是否创建备份
-                backup_config = self.config_manager.get_config('backup_config') or {}
+                backup_config = self._cfg('backup_config')
                 backup_enabled = not args.no_backup and (args.backup or backup_config.get('enabled', True))
                 
                 logger.info("跳过确认提示以进行测试")
@@ -425,14 +821,14 @@ class CLI:
                 )
             else:
                 # 正常加载配置文件
-                load_result = self.profile_manager.load_profile(args.profile)
+                load_result = self._load_profile_cached(args.profile)
                 if load_result['status'] != 'success':
                     logger.error(f"加载配置文件失败: {load_result['error']}")
                     return 1
                 
                 # 确定是否创建备份
                 # 获取备份配置
-                backup_config = self.config_manager.get_config('backup_config') or {}
+                backup_config = self._cfg('backup_config')
                 backup_enabled = not args.no_backup and (args.backup or backup_config.get('enabled', True))
                 
                 # 如果不是dry-run且需要备份，询问确认
@@ -486,14 +882,15 @@ class CLI:
         Args:
             args: 命令行参数
         """
+        from src.seo_automation.auto_optimizer.backup_manager import BackupManager
+        
         # 获取备份目录
         # 获取备份目录配置
-        backup_config = self.config_manager.get_config('backup_config') or {}
+        backup_config = self._cfg('backup_config')
         backup_dir = backup_config.get('backup_directory')
         if not backup_dir:
             # 默认备份目录
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            backup_dir = os.path.join(base_dir, 'backups')
+            backup_dir = _DEFAULT_BACKUP_DIR
         
         # 初始化备份管理器
         backup_manager = BackupManager(self.config_manager)
@@ -521,7 +918,7 @@ class CLI:
                 
         elif args.backup_command == 'create':
             # 加载配置文件以获取网站路径
-            load_result = self.profile_manager.load_profile(args.profile)
+            load_result = self._load_profile_cached(args.profile)
             if load_result['status'] != 'success':
                 logger.error(f"加载配置文件失败: {load_result['error']}")
                 return
@@ -529,7 +926,7 @@ class CLI:
             site_path = load_result['profile_content']['site_path']
             
             # 创建备份
-            backup_name = args.name or f"backup_{args.profile}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            backup_name = args.name or f"backup_{args.profile}_{time.strftime(_TS_FMT)}"
             
             logger.info(f"开始创建备份: {backup_name}")
             logger.info(f"网站路径: {site_path}")
@@ -558,7 +955,7 @@ class CLI:
                 return
             
             # 查找使用该备份的配置文件
-            profiles = self.profile_manager.list_profiles()
+            profiles = self._list_profiles_cached()
             restore_path = None
             
             for profile in profiles:
@@ -616,9 +1013,10 @@ class CLI:
             
             logger.info("\n当前配置:\n")
             
-            # 格式化输出配置
-            formatted_config = json.dumps(config, ensure_ascii=False, indent=2)
-            logger.info(formatted_config)
+            # 配置直接序列化到标准输出，不经过日志处理器，也不生成完整的中间字符串
+            json.dump(config, sys.stdout, ensure_ascii=False, indent=2)
+            sys.stdout.write('\n')
+            sys.stdout.flush()
     
     def show_version(self):
         """
@@ -632,235 +1030,245 @@ class CLI:
         """
         显示分析结果
         
+        所有内容先写入缓冲区，最后作为一条日志输出，避免每行都经过一次日志处理器。
+        未启用INFO级别日志时不生成内容。
+        
         Args:
             results: 分析结果
             verbose: 是否显示详细结果
         """
-        logger.info("\n===== SEO分析结果 =====\n")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        buf = io.StringIO()
+        buf.write("\n===== SEO分析结果 =====\n\n")
         
         # 总体评分
         if 'overall_score' in results:
-            logger.info(f"总体SEO评分: {results['overall_score']}/100")
-            logger.info(f"网站健康状态: {self._get_health_status(results['overall_score'])}\n")
+            buf.write(f"总体SEO评分: {results['overall_score']}/100\n")
+            buf.write(f"网站健康状态: {self._get_health_status(results['overall_score'])}\n\n")
         
         # 页面统计
         if 'page_stats' in results:
-            logger.info(f"分析页面数: {results['page_stats'].get('total_pages', 0)}")
-            logger.info(f"发现错误: {results['page_stats'].get('error_pages', 0)}")
-            logger.info(f"平均页面大小: {results['page_stats'].get('avg_page_size', 'N/A')}")
-            logger.info(f"平均加载时间: {results['page_stats'].get('avg_load_time', 'N/A')}\n")
+            buf.write(f"分析页面数: {results['page_stats'].get('total_pages', 0)}\n")
+            buf.write(f"发现错误: {results['page_stats'].get('error_pages', 0)}\n")
+            buf.write(f"平均页面大小: {results['page_stats'].get('avg_page_size', 'N/A')}\n")
+            buf.write(f"平均加载时间: {results['page_stats'].get('avg_load_time', 'N/A')}\n\n")
         
         # 各维度评分
         if 'category_scores' in results:
-            logger.info("各维度评分:")
+            buf.write("各维度评分:\n")
             for category, score in results['category_scores'].items():
-                logger.info(f"  - {self._format_category_name(category)}: {score}/100")
-            logger.info()
+                buf.write(f"  - {_format_name(category)}: {score}/100\n")
+            buf.write("\n")
         
         # 问题统计
         if 'issues' in results and results['issues']:
-            logger.info("发现的问题:")
+            buf.write("发现的问题:\n")
             
             # 按严重程度分组
-            severity_groups = {
-                'critical': [],
-                'high': [],
-                'medium': [],
-                'low': []
-            }
-            
+            severity_groups = defaultdict(list)
             for issue in results['issues']:
-                severity = issue.get('severity', 'medium')
-                severity_groups[severity].append(issue)
+                severity_groups[issue.get('severity', 'medium')].append(issue)
             
             # 显示不同严重程度的问题
-            for severity in ['critical', 'high', 'medium', 'low']:
-                issues = severity_groups[severity]
-                if issues:
-                    logger.info(f"  {severity.upper()} ({len(issues)}):")
-                    
-                    # 最多显示前5个问题
-                    for i, issue in enumerate(issues[:5]):
-                        logger.info(f"    {i+1}. {issue.get('description', '未知问题')}")
-                        if 'affected_pages' in issue and issue['affected_pages']:
-                            logger.info(f"       影响页面: {', '.join(issue['affected_pages'][:3])}{'...' if len(issue['affected_pages']) > 3 else ''}")
-                    
-                    if len(issues) > 5:
-                        logger.info(f"    ... 还有 {len(issues) - 5} 个问题")
+            for severity in _SEVERITY_ORDER:
+                issues = severity_groups.get(severity)
+                if not issues:
+                    continue
+                issue_count = len(issues)
+                buf.write(f"  {severity.upper()} ({issue_count}):\n")
+                
+                # 最多显示前5个问题
+                for i, issue in enumerate(itertools.islice(issues, 5), 1):
+                    buf.write(f"    {i}. {issue.get('description', '未知问题')}\n")
+                    affected_pages = issue.get('affected_pages')
+                    if affected_pages:
+                        buf.write(f"       影响页面: {', '.join(itertools.islice(affected_pages, 3))}{'...' if len(affected_pages) > 3 else ''}\n")
+                
+                if issue_count > 5:
+                    buf.write(f"    ... 还有 {issue_count - 5} 个问题\n")
             
-            logger.info()
+            buf.write("\n")
         
         # 如果是详细模式，显示更多信息
         if verbose:
             if 'pages' in results and results['pages']:
-                logger.info("页面详细分析:")
+                buf.write("页面详细分析:\n")
                 
                 # 显示前3个页面的详细信息
-                for page in results['pages'][:3]:
-                    logger.info(f"  URL: {page.get('url', 'N/A')}")
-                    logger.info(f"  评分: {page.get('score', 'N/A')}/100")
+                for page in itertools.islice(results['pages'], 3):
+                    buf.write(f"  URL: {page.get('url', 'N/A')}\n")
+                    buf.write(f"  评分: {page.get('score', 'N/A')}/100\n")
                     
                     if 'issues' in page:
-                        logger.info(f"  问题: {len(page['issues'])}")
-                        for issue in page['issues'][:5]:
-                            logger.info(f"    - {issue.get('description', '未知问题')}")
+                        buf.write(f"  问题: {len(page['issues'])}\n")
+                        for issue in itertools.islice(page['issues'], 5):
+                            buf.write(f"    - {issue.get('description', '未知问题')}\n")
                     
-                    logger.info("")
+                    buf.write("\n")
                 
                 if len(results['pages']) > 3:
-                    logger.info(f"  ... 还有 {len(results['pages']) - 3} 个页面")
+                    buf.write(f"  ... 还有 {len(results['pages']) - 3} 个页面\n")
+        
+        logger.info(buf.getvalue().rstrip('\n'))
     
     def _display_recommendations(self, recommendations: List[Dict[str, Any]]):
         """
         显示优化建议
         
+        所有内容先写入缓冲区，最后作为一条日志输出。未启用INFO级别日志时不生成内容。
+        
         Args:
             recommendations: 优化建议列表
         """
-        logger.info("\n===== SEO优化建议 =====\n")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        buf = io.StringIO()
+        buf.write("\n===== SEO优化建议 =====\n\n")
         
         if not recommendations:
-            logger.info("未发现需要优化的问题。您的网站SEO状况良好！\n")
+            buf.write("未发现需要优化的问题。您的网站SEO状况良好！\n")
+            logger.info(buf.getvalue())
             return
         
         # 按优先级分组
-        priority_groups = {
-            'high': [],
-            'medium': [],
-            'low': []
-        }
-        
+        priority_groups = defaultdict(list)
         for rec in recommendations:
-            priority = rec.get('priority', 'medium')
-            priority_groups[priority].append(rec)
+            priority_groups[rec.get('priority', 'medium')].append(rec)
+        counts = {priority: len(priority_groups.get(priority, ())) for priority in _PRIORITY_ORDER}
         
         # 显示不同优先级的建议
-        for priority in ['high', 'medium', 'low']:
-            recs = priority_groups[priority]
-            if recs:
-                logger.info(f"{'!' * 5} {priority.upper()} PRIORITY {'!' * 5} ({len(recs)} 项)\n")
-                
-                for i, rec in enumerate(recs, 1):
-                    logger.info(f"{i}. {rec.get('title', '未命名建议')}")
-                    logger.info(f"   描述: {rec.get('description', '')}")
-                    
-                    if 'affected_pages' in rec and rec['affected_pages']:
-                        logger.info(f"   影响页面: {len(rec['affected_pages'])} 个")
-                        logger.info(f"   示例: {', '.join(rec['affected_pages'][:3])}{'...' if len(rec['affected_pages']) > 3 else ''}")
-                    
-                    if 'potential_impact' in rec:
-                        logger.info(f"   潜在影响: {rec['potential_impact']}")
-                    
-                    if 'recommended_action' in rec:
-                        logger.info(f"   建议操作: {rec['recommended_action']}")
-                    
-                    logger.info()
+        for priority in _PRIORITY_ORDER:
+            recs = priority_groups.get(priority)
+            if not recs:
+                continue
+            buf.write(f"{'!' * 5} {priority.upper()} PRIORITY {'!' * 5} ({counts[priority]} 项)\n\n")
+            
+            for i, rec in enumerate(recs, 1):
+                buf.write(f"{i}. {rec.get('title', '未命名建议')}\n")
+                buf.write(f"   描述: {rec.get('description', '')}\n")
+                
+                affected_pages = rec.get('affected_pages')
+                if affected_pages:
+                    buf.write(f"   影响页面: {len(affected_pages)} 个\n")
+                    buf.write(f"   示例: {', '.join(itertools.islice(affected_pages, 3))}{'...' if len(affected_pages) > 3 else ''}\n")
+                
+                if 'potential_impact' in rec:
+                    buf.write(f"   潜在影响: {rec['potential_impact']}\n")
+                
+                if 'recommended_action' in rec:
+                    buf.write(f"   建议操作: {rec['recommended_action']}\n")
+                
+                buf.write("\n")
         
-        logger.info("总结:")
-        logger.info(f"  高优先级: {len(priority_groups['high'])} 项")
-        logger.info(f"  中优先级: {len(priority_groups['medium'])} 项")
-        logger.info(f"  低优先级: {len(priority_groups['low'])} 项")
-        logger.info()
+        buf.write("总结:\n")
+        buf.write(f"  高优先级: {counts['high']} 项\n")
+        buf.write(f"  中优先级: {counts['medium']} 项\n")
+        buf.write(f"  低优先级: {counts['low']} 项\n\n")
         
         # 提供优化建议
-        total_recs = sum(len(recs) for recs in priority_groups.values())
-        if total_recs > 0:
-            logger.info("下一步建议:")
-            if len(priority_groups['high']) > 0:
-                logger.info(f"  1. 优先处理 {len(priority_groups['high'])} 个高优先级问题")
-            logger.info(f"  2. 使用 'seo_auto_optimizer optimize --profile <配置文件名称> --dry-run' 查看将要进行的更改")
-            logger.info(f"  3. 确认无误后，使用 'seo_auto_optimizer optimize --profile <配置文件名称>' 执行优化")
-            logger.info()
+        if sum(counts.values()) > 0:
+            buf.write("下一步建议:\n")
+            if counts['high'] > 0:
+                buf.write(f"  1. 优先处理 {counts['high']} 个高优先级问题\n")
+            buf.write(f"  2. 使用 'seo_auto_optimizer optimize --profile <配置文件名称> --dry-run' 查看将要进行的更改\n")
+            buf.write(f"  3. 确认无误后，使用 'seo_auto_optimizer optimize --profile <配置文件名称>' 执行优化\n")
+        
+        logger.info(buf.getvalue().rstrip('\n'))
     
     def _display_optimization_result(self, result: Dict[str, Any]):
         """
         显示优化结果
         
+        所有内容先写入缓冲区，最后作为一条日志输出。未启用INFO级别日志时只输出失败信息。
+        
         Args:
             result: 优化结果
         """
-        logger.info("")
-        logger.info("===== SEO优化结果 =====")
-        logger.info("")
-        
+        info_enabled = logger.isEnabledFor(logging.INFO)
         if result.get('status') != 'success':
+            if info_enabled:
+                logger.info("\n===== SEO优化结果 =====")
             logger.error(f"优化失败: {result.get('error', '未知错误')}")
             return
         
-        logger.info(f"{'模拟优化' if result.get('dry_run', False) else '优化'} {'成功完成' if result.get('status') == 'success' else '失败'}")
+        if not info_enabled:
+            return
+        
+        buf = io.StringIO()
+        buf.write("\n===== SEO优化结果 =====\n\n")
+        
+        buf.write(f"{'模拟优化' if result.get('dry_run', False) else '优化'} {'成功完成' if result.get('status') == 'success' else '失败'}\n")
         
         # 备份信息
         if 'backup_info' in result and result['backup_info']:
             backup_name = result['backup_info'].get('backup_name')
             backup_path = result['backup_info'].get('backup_path')
-            logger.info(f"备份已创建: {backup_name}")
-            logger.info(f"备份路径: {backup_path}")
-            logger.info("")
+            buf.write(f"备份已创建: {backup_name}\n")
+            buf.write(f"备份路径: {backup_path}\n\n")
         
         # 文件修改统计
         if 'changes' in result:
             changes = result['changes']
             total_files = len(changes)
-            total_changes = sum(len(file_changes.get('changes', [])) for file_changes in changes)
             
-            logger.info(f"总文件数: {total_files}")
-            logger.info(f"总修改数: {total_changes}")
-            logger.info("")
+            # 一次遍历同时得到总修改数、按修改类型的统计和前10个文件的修改详情
+            total_changes = 0
+            change_types = Counter()
+            per_file = [None] * min(10, total_files)
+            for index, file_changes in enumerate(changes):
+                file_change_list = file_changes.get('changes') or ()
+                file_change_types = Counter(change.get('type', 'unknown') for change in file_change_list)
+                total_changes += len(file_change_list)
+                change_types.update(file_change_types)
+                if index < 10:
+                    per_file[index] = (file_changes.get('file_path'), len(file_change_list), file_change_types)
             
-            # 按修改类型统计
-            change_types = {}
-            for file_changes in changes:
-                for change in file_changes.get('changes', []):
-                    change_type = change.get('type', 'unknown')
-                    change_types[change_type] = change_types.get(change_type, 0) + 1
+            buf.write(f"总文件数: {total_files}\n")
+            buf.write(f"总修改数: {total_changes}\n\n")
             
-            logger.info("修改类型统计:")
+            buf.write("修改类型统计:\n")
             if change_types:
                 for change_type, count in change_types.items():
-                    logger.info(f"  - {self._format_change_type(change_type)}: {count} 次")
+                    buf.write(f"  - {_format_name(change_type)}: {count} 次\n")
             else:
-                logger.info("  无修改")
+                buf.write("  无修改\n")
             
-            logger.info("")
+            buf.write("\n")
             
             # 显示前几个文件的修改详情
-            logger.info("修改详情:")
-            for i, file_changes in enumerate(changes[:10], 1):
-                file_path = file_changes.get('file_path')
-                file_changes_count = len(file_changes.get('changes', []))
-                
-                logger.info(f"{i}. {file_path}")
-                logger.info(f"   修改: {file_changes_count} 处")
+            buf.write("修改详情:\n")
+            for i, (file_path, file_changes_count, file_change_types) in enumerate(per_file, 1):
+                buf.write(f"{i}. {file_path}\n")
+                buf.write(f"   修改: {file_changes_count} 处\n")
                 
                 # 显示该文件的修改类型
-                file_change_types = {}
-                for change in file_changes.get('changes', []):
-                    change_type = change.get('type', 'unknown')
-                    file_change_types[change_type] = file_change_types.get(change_type, 0) + 1
-                
                 if file_change_types:
-                    logger.info(f"   类型: {', '.join([f'{self._format_change_type(ct)} ({count})' for ct, count in file_change_types.items()])}")
+                    buf.write(f"   类型: {', '.join([f'{_format_name(ct)} ({count})' for ct, count in file_change_types.items()])}\n")
                 
-                logger.info()
+                buf.write("\n")
             
             if len(changes) > 10:
-                logger.info(f"... 还有 {len(changes) - 10} 个文件\n")
+                buf.write(f"... 还有 {len(changes) - 10} 个文件\n\n")
         
         # 优化效果估计
         if 'estimated_impact' in result:
             impact = result['estimated_impact']
-            logger.info("优化效果估计:")
-            logger.info(f"  预计SEO评分提升: +{impact.get('score_improvement', '0')}")
-            logger.info(f"  预计性能提升: {impact.get('performance_improvement', '0')}%")
-            logger.info()
+            buf.write("优化效果估计:\n")
+            buf.write(f"  预计SEO评分提升: +{impact.get('score_improvement', '0')}\n")
+            buf.write(f"  预计性能提升: {impact.get('performance_improvement', '0')}%\n\n")
         
         # 下一步建议
-        logger.info("下一步建议:")
-        logger.info("  1. 检查网站以确保优化没有引入任何问题")
-        logger.info("  2. 运行 'seo_auto_optimizer analyze --profile <配置文件名称>' 再次分析以查看改进")
-        logger.info("  3. 定期重新优化以保持良好的SEO状态")
+        buf.write("下一步建议:\n")
+        buf.write("  1. 检查网站以确保优化没有引入任何问题\n")
+        buf.write("  2. 运行 'seo_auto_optimizer analyze --profile <配置文件名称>' 再次分析以查看改进\n")
+        buf.write("  3. 定期重新优化以保持良好的SEO状态\n")
         if 'backup_info' in result and result['backup_info']:
-            logger.info(f"  4. 如需撤销更改，请使用 'seo_auto_optimizer backup restore --name {result['backup_info'].get('backup_name')} --confirm'")
+            buf.write(f"  4. 如需撤销更改，请使用 'seo_auto_optimizer backup restore --name {result['backup_info'].get('backup_name')} --confirm'\n")
+        
+        logger.info(buf.getvalue().rstrip('\n'))
     
     def _save_analysis_results(self, results: Dict[str, Any], output_path: str):
         """
@@ -872,12 +1280,11 @@ class CLI:
         """
         # 确保输出目录存在
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
         # 保存为JSON格式
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        _write_json(results, output_path)
     
     def _save_recommendations(self, recommendations: List[Dict[str, Any]], output_path: str):
         """
@@ -889,19 +1296,18 @@ class CLI:
         """
         # 确保输出目录存在
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
         # 构建建议报告
         report = {
-            'generated_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'generated_at': self._now_stamp(),
             'total_recommendations': len(recommendations),
             'recommendations': recommendations
         }
         
         # 保存为JSON格式
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        _write_json(report, output_path)
     
     def _save_optimization_report(self, result: Dict[str, Any], output_path: str):
         """
@@ -913,24 +1319,28 @@ class CLI:
         """
         # 确保输出目录存在
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
-        # 构建报告
+        changes = result.get('changes', [])
+        total_changes = 0
+        for file_changes in changes:
+            total_changes += len(file_changes.get('changes') or ())
+        
+        # 构建报告，修改记录按条写出，不生成完整的报告字符串
         report = {
-            'generated_at': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'generated_at': self._now_stamp(),
             'status': result.get('status', 'failed'),
             'dry_run': result.get('dry_run', False),
             'backup_info': result.get('backup_info', {}),
-            'total_files_changed': len(result.get('changes', [])),
-            'total_changes': sum(len(file_changes.get('changes', [])) for file_changes in result.get('changes', [])),
-            'changes': result.get('changes', []),
+            'total_files_changed': len(changes),
+            'total_changes': total_changes,
+            'changes': changes,
             'estimated_impact': result.get('estimated_impact', {})
         }
         
         # 保存为JSON格式
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        _write_json(report, output_path, stream_key='changes')
     
     def _get_health_status(self, score: int) -> str:
         """
@@ -963,8 +1373,7 @@ class CLI:
         Returns:
             str: 格式化后的名称
         """
-        # 将下划线替换为空格，并将首字母大写
-        return ' '.join(word.capitalize() for word in category.split('_'))
+        return _format_name(category)
     
     def _format_change_type(self, change_type: str) -> str:
         """
@@ -976,8 +1385,7 @@ class CLI:
         Returns:
             str: 格式化后的名称
         """
-        # 将下划线替换为空格，并将首字母大写
-        return ' '.join(word.capitalize() for word in change_type.split('_'))
+        return _format_name(change_type)
 
 
 def main():
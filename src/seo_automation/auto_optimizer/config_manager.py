@@ -2,11 +2,43 @@
 
 import json
 import os
+import re
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Pattern, FrozenSet
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 配置键不存在时的哨兵值，用于区分值为None的配置
+_MISSING = object()
+
+# 保存配置文件时使用的写缓冲区大小
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """
+    判断两个配置值是否相同，要求各层的类型也一致（True与1、1.0与1视为不同）
+    
+    Args:
+        a: 配置值
+        b: 配置值
+        
+    Returns:
+        bool: 值和类型都相同时返回True
+    """
+    if type(a) is not type(b):
+        return False
+    if type(a) is dict:
+        return a.keys() == b.keys() and all(_same_value(v, b[k]) for k, v in a.items())
+    if type(a) is list or type(a) is tuple:
+        return len(a) == len(b) and all(_same_value(x, y) for x, y in zip(a, b))
+    return a == b
+
 
 class ConfigManager:
     """SEO自优化程序配置管理器"""
@@ -66,6 +98,12 @@ class ConfigManager:
         ]
     }
     
+    # 默认配置的JSON序列化结果，每个实例从中解析出独立的副本，嵌套字典不会与DEFAULT_CONFIG共享
+    _DEFAULT_CONFIG_JSON = orjson.dumps(DEFAULT_CONFIG) if orjson is not None else json.dumps(DEFAULT_CONFIG)
+    
+    # 点表示法配置键路径的拆分结果缓存：键路径 -> 各级键
+    _PATH_CACHE: Dict[str, Tuple[str, ...]] = {}
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         初始化配置管理器
@@ -74,7 +112,16 @@ class ConfigManager:
             config_path: 配置文件路径，如果为None则使用默认配置
         """
         self.config_path = config_path
-        self.config = self.DEFAULT_CONFIG.copy()
+        # 配置验证通过后置为True，配置被修改或重新加载时失效
+        self._validated = False
+        # exclude_patterns合并后的正则及其对应的模式元组
+        self._exclude_re = None
+        self._exclude_re_key = None
+        # file_types转换成的扩展名集合及其对应的配置内容
+        self._file_type_sets = None
+        self._file_type_sets_key = None
+        self.config = (orjson.loads(self._DEFAULT_CONFIG_JSON) if orjson is not None
+                       else json.loads(self._DEFAULT_CONFIG_JSON))
         
         # 如果提供了配置文件路径，则加载配置
         if config_path:
@@ -95,11 +142,13 @@ class ConfigManager:
                 logger.warning(f"配置文件不存在: {config_path}，将使用默认配置")
                 return False
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
+            with open(config_path, 'rb') as f:
+                data = f.read()
+            user_config = orjson.loads(data) if orjson is not None else json.loads(data)
             
             # 合并用户配置到默认配置
             self._merge_config(self.config, user_config)
+            self._validated = False
             logger.info(f"成功加载配置文件: {config_path}")
             return True
         except Exception as e:
@@ -122,10 +171,13 @@ class ConfigManager:
                 logger.error("未指定保存路径")
                 return False
             
-            # 确保目录存在
-            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            # 确保目录存在，路径不含目录时保存到当前目录
+            target_dir = os.path.dirname(target_path)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
             
-            with open(target_path, 'w', encoding='utf-8') as f:
+            # 配置文件可能被手工编辑或纳入版本管理，始终用标准库输出四格缩进，保证格式稳定
+            with open(target_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
                 json.dump(self.config, f, indent=4, ensure_ascii=False)
             
             logger.info(f"成功保存配置到: {target_path}")
@@ -147,7 +199,17 @@ class ConfigManager:
         if key_path is None:
             return self.config
         
-        keys = key_path.split('.')
+        # 顶层键直接查找，无需拆分路径
+        if '.' not in key_path:
+            value = self.config.get(key_path, _MISSING)
+            if value is _MISSING:
+                logger.warning(f"配置键不存在: {key_path}")
+                return None
+            return value
+        
+        keys = self._PATH_CACHE.get(key_path)
+        if keys is None:
+            keys = self._PATH_CACHE[key_path] = tuple(key_path.split('.'))
         value = self.config
         
         for key in keys:
@@ -159,6 +221,54 @@ class ConfigManager:
         
         return value
     
+    def get_exclude_regex(self) -> Optional[Pattern]:
+        """
+        获取由exclude_patterns合并成的正则表达式，各模式按字面匹配
+        
+        编译结果按模式列表缓存，列表内容变化后重新编译，遍历文件时只需对每个路径执行一次search。
+        
+        Returns:
+            Pattern: 合并后的正则表达式，没有排除模式时返回None
+        """
+        patterns = self.config.get('exclude_patterns')
+        if not isinstance(patterns, list) or not patterns:
+            return None
+        
+        key = tuple(patterns)
+        if key != self._exclude_re_key:
+            self._exclude_re = re.compile('|'.join(map(re.escape, patterns)))
+            self._exclude_re_key = key
+        return self._exclude_re
+    
+    def get_file_type_sets(self) -> Tuple[Dict[str, FrozenSet[str]], FrozenSet[str]]:
+        """
+        获取file_types中各类别的扩展名集合，以及所有已知扩展名的集合
+        
+        配置本身仍保存为列表以便序列化；集合按配置内容缓存，扩展名判断为O(1)哈希查找。
+        
+        Returns:
+            Tuple: (类别 -> 扩展名集合, 所有扩展名集合)
+        """
+        file_types = self.config.get('file_types')
+        if not isinstance(file_types, dict):
+            file_types = {}
+        
+        key = tuple((category, tuple(exts)) for category, exts in file_types.items())
+        if key != self._file_type_sets_key:
+            ext_sets = {category: frozenset(exts) for category, exts in file_types.items()}
+            self._file_type_sets = (ext_sets, frozenset().union(*ext_sets.values()))
+            self._file_type_sets_key = key
+        return self._file_type_sets
+    
+    def get_all_config(self) -> Dict[str, Any]:
+        """
+        获取全部配置
+        
+        Returns:
+            Dict: 当前使用的配置字典本身（不是副本），调用方不应直接修改
+        """
+        return self.config
+    
     def set_config(self, key_path: str, value: Any) -> bool:
         """
         设置配置值
@@ -185,9 +295,16 @@ class ConfigManager:
                     config[key] = {}
                 config = config[key]
             
+            # 值和类型都未变化时不做修改，也不使验证结果失效；
+            # 同一个字典或列表对象可能已被原地修改，仍按已变化处理
+            current = config.get(keys[-1], _MISSING)
+            if _same_value(current, value) and (current is not value or not isinstance(value, (dict, list))):
+                return True
+            
             # 设置值
             config[keys[-1]] = value
-            logger.info(f"设置配置: {key_path} = {value}")
+            self._validated = False
+            logger.debug("设置配置: %s = %s", key_path, value)
             return True
         except Exception as e:
             logger.error(f"设置配置失败: {str(e)}")
@@ -197,22 +314,31 @@ class ConfigManager:
         """
         验证配置的有效性
         
+        验证通过的结果会被记住，直到下次set_config或load_config；验证失败时每次都重新检查。
+        
         Returns:
             bool: 配置是否有效
         """
+        if self._validated:
+            return True
+        
         try:
-            logger.info(f"开始验证配置，配置管理器实例ID: {id(self)}")
-            logger.info(f"配置对象类型: {type(self).__name__}")
-            logger.info(f"配置内容概览: {type(self.config).__name__}，包含键: {list(self.config.keys())}")
+            # 诊断信息只在调试级别输出，使用惰性格式化，未启用调试日志时不构造消息
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("开始验证配置，配置管理器实例ID: %s", id(self))
+                logger.debug("配置对象类型: %s", type(self).__name__)
+                logger.debug("配置内容概览: %s，包含键: %s", type(self.config).__name__, list(self.config.keys()))
             
             # 检查必要的配置项
             required_keys = ['site_path']
-            logger.info(f"检查必要配置项: {required_keys}")
+            logger.debug("检查必要配置项: %s", required_keys)
             
             for key in required_keys:
-                logger.info(f"检查配置项: {key}")
-                value = self.get_config(key)
-                logger.info(f"配置项 {key} 的值: {value}，类型: {type(value).__name__}")
+                logger.debug("检查配置项: %s", key)
+                value = self.config.get(key)
+                if debug:
+                    logger.debug("配置项 %s 的值: %s，类型: %s", key, value, type(value).__name__)
                 
                 # 检查是否存在ConfigManager对象
                 if isinstance(value, type(self)):
@@ -224,9 +350,10 @@ class ConfigManager:
                     return False
             
             # 验证网站路径
-            logger.info("开始验证网站路径")
-            site_path = self.get_config('site_path')
-            logger.info(f"site_path值: {site_path}，类型: {type(site_path).__name__}")
+            logger.debug("开始验证网站路径")
+            site_path = self.config.get('site_path')
+            if debug:
+                logger.debug("site_path值: %s，类型: %s", site_path, type(site_path).__name__)
             
             # 添加类型检查，确保site_path是字符串类型
             if not isinstance(site_path, str):
@@ -236,7 +363,7 @@ class ConfigManager:
             try:
                 path_exists = os.path.exists(site_path)
                 is_dir = os.path.isdir(site_path) if path_exists else False
-                logger.info(f"网站路径存在: {path_exists}，是目录: {is_dir}")
+                logger.debug("网站路径存在: %s，是目录: %s", path_exists, is_dir)
                 
                 if not path_exists or not is_dir:
                     logger.error(f"网站路径不存在或不是目录: {site_path}")
@@ -250,25 +377,28 @@ class ConfigManager:
                 return False
             
             # 验证优化级别
-            logger.info("开始验证优化级别")
-            optimize_level = self.get_config('optimization_config.auto_optimize_level')
-            logger.info(f"optimize_level值: {optimize_level}，类型: {type(optimize_level).__name__}")
+            logger.debug("开始验证优化级别")
+            optimization_config = self.config.get('optimization_config')
+            optimize_level = optimization_config.get('auto_optimize_level') if isinstance(optimization_config, dict) else None
+            if debug:
+                logger.debug("optimize_level值: %s，类型: %s", optimize_level, type(optimize_level).__name__)
             
             if optimize_level not in ['low', 'medium', 'high']:
                 logger.error(f"无效的优化级别: {optimize_level}，必须是 'low', 'medium' 或 'high'")
                 return False
             
             # 验证备份目录配置
-            logger.info("验证备份目录配置")
-            backup_dir = self.get_config('backup_dir')
-            logger.info(f"backup_dir值: {backup_dir}，类型: {type(backup_dir).__name__}")
+            backup_dir = self.config.get('backup_dir')
+            if debug:
+                logger.debug("验证备份目录配置，backup_dir值: %s，类型: %s", backup_dir, type(backup_dir).__name__)
             
             # 验证报告目录配置
-            logger.info("验证报告目录配置")
-            report_dir = self.get_config('report_dir')
-            logger.info(f"report_dir值: {report_dir}，类型: {type(report_dir).__name__}")
+            report_dir = self.config.get('report_dir')
+            if debug:
+                logger.debug("验证报告目录配置，report_dir值: %s，类型: %s", report_dir, type(report_dir).__name__)
             
             logger.info("配置验证通过")
+            self._validated = True
             return True
         except Exception as e:
             logger.error(f"配置验证过程中发生异常: {str(e)}")
@@ -277,7 +407,9 @@ class ConfigManager:
     
     def _merge_config(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """
-        递归合并配置字典
+        合并配置字典，嵌套字典逐层合并
+        
+        使用显式栈代替递归，配置来自JSON解析，只需精确判断dict类型。
         
         Args:
             base: 基础配置
@@ -286,13 +418,17 @@ class ConfigManager:
         Returns:
             Dict: 合并后的配置
         """
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                # 递归合并嵌套字典
-                self._merge_config(base[key], value)
-            else:
-                # 直接覆盖
-                base[key] = value
+        stack = [(base, override)]
+        while stack:
+            base_dict, override_dict = stack.pop()
+            for key, value in override_dict.items():
+                base_value = base_dict.get(key)
+                if type(base_value) is dict and type(value) is dict:
+                    # 合并嵌套字典
+                    stack.append((base_value, value))
+                else:
+                    # 直接覆盖
+                    base_dict[key] = value
         
         return base
     
@@ -1,13 +1,213 @@
 """日志管理器，负责记录程序运行过程中的各种日志"""
 
 import os
+import time
 import logging
 import logging.handlers
 import datetime
 import json
 import shutil
+import queue
+import atexit
+import threading
+import zipfile
 from typing import Optional, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 日志格式中未使用线程和多进程信息，关闭后每条记录不再采集这些字段；
+# 进程ID由_ProcessIdFilter按缓存值注入
+logging.logThreads = False
+logging.logMultiprocessing = False
+logging.logProcesses = False
+
+# 导出日志时复制文件使用的缓冲区大小
+_EXPORT_COPY_BUFFER_SIZE = 1 << 20
+
+
+def _fast_json(obj: Any) -> bytes:
+    """
+    将日志附带的结果数据预先序列化为紧凑的UTF-8 JSON字节串，优先使用orjson
+    
+    orjson无法处理的数据（超过64位的整数、元组键等）改用标准库json；
+    仍然失败时（循环引用、嵌套过深等）退回repr，保证记录日志时不会抛出异常
+    
+    Args:
+        obj: 要序列化的对象，无法直接序列化的值按str()处理
+        
+    Returns:
+        bytes: JSON字节串；无法序列化时为repr文本，repr也失败时为空字节串
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except Exception:
+            pass
+    try:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+    except Exception:
+        pass
+    try:
+        return repr(obj).encode('utf-8', 'backslashreplace')
+    except Exception:
+        return b''
+
+
+class _ProcessIdFilter(logging.Filter):
+    """
+    为日志记录注入缓存的进程ID，避免每条记录调用os.getpid()
+    """
+    
+    _pid = os.getpid()
+    
+    @classmethod
+    def _refresh_pid(cls):
+        """
+        fork后刷新子进程中缓存的进程ID
+        """
+        cls._pid = os.getpid()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.process = self._pid
+        return True
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_ProcessIdFilter._refresh_pid)
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    按秒缓存asctime的格式化器，同一秒内的日志记录只调用一次time.strftime
+    """
+    
+    def __init__(self, fmt: Optional[str] = None):
+        super().__init__(fmt)
+        # (秒, 格式化结果)作为整体替换，多线程下不会读到不匹配的组合
+        self._cached = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_time = self._cached
+        if second != cached_second:
+            cached_time = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached = (second, cached_time)
+        return self.default_msec_format % (cached_time, record.msecs)
+
+
+class _BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    批量写入的轮转文件处理器
+    
+    emit只格式化并缓存记录，累计BATCH_SIZE条或flush时合并为一次write调用，
+    轮转检查也按批次进行，不再对每条记录seek/stat日志文件。
+    配合_BatchingQueueListener使用时，这些工作都在监听线程中完成
+    """
+    
+    # 每次写入合并的最大记录数
+    BATCH_SIZE = 32
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0, encoding: Optional[str] = None):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self._pending = []
+        self._size = self.stream.tell()
+    
+    def emit(self, record: logging.LogRecord):
+        """
+        格式化日志记录并加入待写入批次
+        
+        Args:
+            record: 日志记录
+        """
+        try:
+            self._pending.append(self.format(record) + self.terminator)
+            if len(self._pending) >= self.BATCH_SIZE:
+                self._drain()
+        except Exception:
+            self.handleError(record)
+    
+    def _drain(self):
+        """
+        将待写入的记录作为一个批次写入日志文件
+        """
+        with self.lock:
+            if not self._pending:
+                return
+            data = ''.join(self._pending)
+            self._pending = []
+            
+            if self.stream is None:
+                self.stream = self._open()
+                self._size = self.stream.tell()
+            
+            if self.maxBytes > 0 and self._size > 0 and self._size + len(data) >= self.maxBytes:
+                self.doRollover()
+            
+            self.stream.write(data)
+            # tell()会先刷新缓冲区，每批恰好一次write调用，同时得到实际字节数
+            self._size = self.stream.tell()
+    
+    def doRollover(self):
+        """
+        执行日志轮转
+        """
+        with self.lock:
+            super().doRollover()
+            self._size = 0
+    
+    def flush(self):
+        """
+        写出所有待写入的记录
+        """
+        self._drain()
+        super().flush()
+    
+    def close(self):
+        """
+        写出剩余记录后关闭文件
+        """
+        self._drain()
+        super().close()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    在队列暂时取空时刷新处理器的队列监听器，使批量处理器在空闲时及时落盘
+    """
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """
+        从队列取出一条记录，队列为空时先刷新所有处理器再阻塞等待
+        
+        Args:
+            block: 是否阻塞等待
+            
+        Returns:
+            logging.LogRecord: 日志记录
+        """
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+        
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get(block)
+    
+    def stop(self):
+        """
+        停止监听线程并刷新处理器，可重复调用
+        """
+        if self._thread is None:
+            return
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
 
 class LogManager:
     """
@@ -27,6 +227,13 @@ class LogManager:
     # 默认日志格式化
     DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
+    # 错误日志格式化，包含更多详细信息
+    ERROR_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(process)d - %(message)s'
+    
+    # 所有实例共享的格式化器，只在导入时创建一次
+    _SHARED_FMT = _CachedTimeFormatter(DEFAULT_FORMAT)
+    _ERROR_FMT = _CachedTimeFormatter(ERROR_FORMAT)
+    
     def __init__(self, name: str, log_dir: Optional[str] = None, log_level: str = 'info'):
         """
         初始化日志管理器
@@ -45,6 +252,7 @@ class LogManager:
         
         # 创建日志器
         self.logger = self._create_logger()
+        self._refresh_level_cache()
         
         # 添加处理器
         self._add_handlers()
@@ -76,25 +284,47 @@ class LogManager:
         logger = logging.getLogger(self.name)
         logger.setLevel(self.log_level)
         
-        # 避免重复添加处理器
+        # 避免重复添加处理器，同时停止旧的队列监听器并关闭其文件处理器
         if logger.handlers:
-            for handler in logger.handlers:
+            for handler in list(logger.handlers):
                 logger.removeHandler(handler)
+                listener = getattr(handler, 'listener', None)
+                if listener is not None:
+                    listener.stop()
+                    for listened in listener.handlers:
+                        listened.close()
+                handler.close()
         
         return logger
     
+    def _refresh_level_cache(self):
+        """
+        预先计算各日志级别是否启用，供记录方法快速跳过被过滤的日志
+        """
+        self._lvl_cache = {level: self.logger.isEnabledFor(level) for level in self.LOG_LEVELS.values()}
+    
     def _add_handlers(self):
         """
         添加日志处理器
+        
+        控制台处理器直接挂在日志器上；文件和错误日志处理器由队列监听器在后台线程驱动，
+        调用线程只需把记录放入队列
         """
         # 添加控制台处理器
         self._add_console_handler()
         
-        # 添加文件处理器
-        self._add_file_handler()
+        # 创建文件处理器和错误日志处理器
+        self._file_handlers = (self._add_file_handler(), self._add_error_handler())
         
-        # 添加错误日志处理器
-        self._add_error_handler()
+        # 通过队列把记录交给后台监听线程
+        self._queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(self._queue)
+        self._listener = _BatchingQueueListener(self._queue, *self._file_handlers, respect_handler_level=True)
+        queue_handler.listener = self._listener
+        self.logger.addHandler(queue_handler)
+        
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
     def _add_console_handler(self):
         """
@@ -104,20 +334,22 @@ class LogManager:
         console_handler.setLevel(self.log_level)
         
         # 设置控制台日志格式
-        formatter = logging.Formatter(self.DEFAULT_FORMAT)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(LogManager._SHARED_FMT)
         
         self.logger.addHandler(console_handler)
     
-    def _add_file_handler(self):
+    def _add_file_handler(self) -> logging.Handler:
         """
-        添加文件日志处理器，支持日志轮转
+        创建文件日志处理器，支持日志轮转
+        
+        Returns:
+            logging.Handler: 文件日志处理器
         """
         # 日志文件名
         log_filename = os.path.join(self.log_dir, f"{self.name}.log")
         
-        # 创建RotatingFileHandler，每个日志文件最大10MB，最多保留10个备份
-        file_handler = logging.handlers.RotatingFileHandler(
+        # 创建批量写入的轮转处理器，每个日志文件最大10MB，最多保留10个备份
+        file_handler = _BatchedRotatingFileHandler(
             log_filename,
             maxBytes=10 * 1024 * 1024,  # 10MB
             backupCount=10,
@@ -126,20 +358,22 @@ class LogManager:
         file_handler.setLevel(self.log_level)
         
         # 设置文件日志格式
-        formatter = logging.Formatter(self.DEFAULT_FORMAT)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(LogManager._SHARED_FMT)
         
-        self.logger.addHandler(file_handler)
+        return file_handler
     
-    def _add_error_handler(self):
+    def _add_error_handler(self) -> logging.Handler:
         """
-        添加错误日志处理器，专门记录错误和关键信息
+        创建错误日志处理器，专门记录错误和关键信息
+        
+        Returns:
+            logging.Handler: 错误日志处理器
         """
         # 错误日志文件名
         error_log_filename = os.path.join(self.log_dir, f"{self.name}_error.log")
         
-        # 创建RotatingFileHandler，每个日志文件最大5MB，最多保留5个备份
-        error_handler = logging.handlers.RotatingFileHandler(
+        # 创建批量写入的轮转处理器，每个日志文件最大5MB，最多保留5个备份
+        error_handler = _BatchedRotatingFileHandler(
             error_log_filename,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=5,
@@ -147,13 +381,11 @@ class LogManager:
         )
         error_handler.setLevel(logging.ERROR)
         
-        # 设置错误日志格式，包含更多详细信息
-        error_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(process)d - %(message)s'
-        )
-        error_handler.setFormatter(error_formatter)
+        # 设置错误日志格式，进程ID由过滤器注入
+        error_handler.addFilter(_ProcessIdFilter())
+        error_handler.setFormatter(LogManager._ERROR_FMT)
         
-        self.logger.addHandler(error_handler)
+        return error_handler
     
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
         """
@@ -163,6 +395,8 @@ class LogManager:
             message: 日志消息
             extra: 额外的上下文信息
         """
+        if not self._lvl_cache[logging.DEBUG]:
+            return
         if extra:
             self.logger.debug(message, extra=extra)
         else:
@@ -176,6 +410,8 @@ class LogManager:
             message: 日志消息
             extra: 额外的上下文信息
         """
+        if not self._lvl_cache[logging.INFO]:
+            return
         if extra:
             self.logger.info(message, extra=extra)
         else:
@@ -189,6 +425,8 @@ class LogManager:
             message: 日志消息
             extra: 额外的上下文信息
         """
+        if not self._lvl_cache[logging.WARNING]:
+            return
         if extra:
             self.logger.warning(message, extra=extra)
         else:
@@ -202,6 +440,8 @@ class LogManager:
             message: 日志消息
             extra: 额外的上下文信息
         """
+        if not self._lvl_cache[logging.ERROR]:
+            return
         if extra:
             self.logger.error(message, extra=extra)
         else:
@@ -215,6 +455,8 @@ class LogManager:
             message: 日志消息
             extra: 额外的上下文信息
         """
+        if not self._lvl_cache[logging.CRITICAL]:
+            return
         if extra:
             self.logger.critical(message, extra=extra)
         else:
@@ -232,20 +474,22 @@ class LogManager:
         if details is None:
             details = {}
         
-        # 构建操作日志消息
-        log_message = f"Operation: {operation}, Status: {status}"
-        
         # 根据状态确定日志级别
         if status == 'failed':
-            self.error(log_message, extra={'operation': operation, 'status': status, 'details': details})
+            level = logging.ERROR
         elif status == 'critical':
-            self.critical(log_message, extra={'operation': operation, 'status': status, 'details': details})
+            level = logging.CRITICAL
         elif status == 'warning':
-            self.warning(log_message, extra={'operation': operation, 'status': status, 'details': details})
-        elif status == 'started':
-            self.info(log_message, extra={'operation': operation, 'status': status, 'details': details})
+            level = logging.WARNING
         else:
-            self.info(log_message, extra={'operation': operation, 'status': status, 'details': details})
+            level = logging.INFO
+        
+        if not self._lvl_cache[level]:
+            return
+        
+        # 构建操作日志消息，操作详情预先序列化
+        log_message = f"Operation: {operation}, Status: {status}"
+        self.logger.log(level, log_message, extra={'operation': operation, 'status': status, 'payload': _fast_json(details)})
     
     def log_analysis_result(self, result: Dict[str, Any]):
         """
@@ -254,11 +498,17 @@ class LogManager:
         Args:
             result: 分析结果
         """
+        if not self._lvl_cache[logging.INFO]:
+            return
+        
+        # 分析结果只序列化一次，两条日志共用
+        payload = _fast_json(result)
+        
         # 记录总体评分
         if 'overall_score' in result:
             self.info(
                 f"Analysis completed. Overall score: {result['overall_score']}/100",
-                extra={'analysis_result': result}
+                extra={'payload': payload}
             )
         
         # 记录发现的问题数量
@@ -266,7 +516,7 @@ class LogManager:
             issue_count = len(result['issues'])
             self.info(
                 f"Found {issue_count} issues during analysis",
-                extra={'analysis_result': result, 'issue_count': issue_count}
+                extra={'payload': payload, 'issue_count': issue_count}
             )
     
     def log_optimization_result(self, result: Dict[str, Any]):
@@ -279,6 +529,9 @@ class LogManager:
         status = result.get('status', 'unknown')
         
         if status == 'success':
+            if not self._lvl_cache[logging.INFO]:
+                return
+            
             # 统计修改数量
             changes = result.get('changes', [])
             total_files = len(changes)
@@ -286,13 +539,16 @@ class LogManager:
             
             self.info(
                 f"Optimization completed successfully. Modified {total_files} files with {total_changes} changes.",
-                extra={'optimization_result': result, 'files_changed': total_files, 'changes_made': total_changes}
+                extra={'payload': _fast_json(result), 'files_changed': total_files, 'changes_made': total_changes}
             )
         else:
+            if not self._lvl_cache[logging.ERROR]:
+                return
+            
             error = result.get('error', 'Unknown error')
             self.error(
                 f"Optimization failed. Error: {error}",
-                extra={'optimization_result': result, 'error': error}
+                extra={'payload': _fast_json(result), 'error': error}
             )
     
     def log_backup_operation(self, operation: str, backup_name: str, status: str, details: Optional[Dict[str, Any]] = None):
@@ -311,54 +567,69 @@ class LogManager:
         # 构建日志消息
         log_message = f"Backup {operation}: {backup_name}, Status: {status}"
         
-        # 根据状态确定日志级别
+        # 根据状态确定日志级别，操作详情只在会被记录时序列化
         if status == 'success':
-            self.info(log_message, extra={'backup_operation': operation, 'backup_name': backup_name, 'details': details})
+            if self._lvl_cache[logging.INFO]:
+                self.info(log_message, extra={'backup_operation': operation, 'backup_name': backup_name, 'payload': _fast_json(details)})
         else:
-            error = details.get('error', 'Unknown error')
-            self.error(log_message, extra={'backup_operation': operation, 'backup_name': backup_name, 'details': details, 'error': error})
+            if self._lvl_cache[logging.ERROR]:
+                error = details.get('error', 'Unknown error')
+                self.error(log_message, extra={'backup_operation': operation, 'backup_name': backup_name, 'payload': _fast_json(details), 'error': error})
     
     def export_logs(self, export_path: str, days: int = 7):
         """
-        导出最近的日志
+        导出最近的日志，打包为zip文件
+        
+        日志文件按原始内容写入压缩包，另附index.json记录各文件的元数据
         
         Args:
-            export_path: 导出路径
+            export_path: 导出路径，扩展名不是.zip时会替换为.zip
             days: 导出最近几天的日志，默认7天
             
         Returns:
             Dict: 导出结果
         """
         try:
+            if not export_path.endswith('.zip'):
+                export_path = os.path.splitext(export_path)[0] + '.zip'
+            
             # 确保导出目录存在
             export_dir = os.path.dirname(export_path)
             if export_dir and not os.path.exists(export_dir):
                 os.makedirs(export_dir, exist_ok=True)
             
             # 获取时间范围
-            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
+            cutoff_ts = (datetime.datetime.now() - datetime.timedelta(days=days)).timestamp()
             
             # 收集日志文件
             log_files = []
-            for filename in os.listdir(self.log_dir):
-                if filename.startswith(self.name) and filename.endswith('.log'):
-                    file_path = os.path.join(self.log_dir, filename)
-                    file_modified = datetime.datetime.fromtimestamp(os.path.getmtime(file_path))
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not (filename.startswith(self.name) and filename.endswith('.log')):
+                        continue
                     
                     # 只导出指定天数内修改的日志
-                    if file_modified >= cutoff_date:
-                        log_files.append(file_path)
-            
-            # 导出日志
-            export_content = {}
-            for log_file in log_files:
-                filename = os.path.basename(log_file)
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    export_content[filename] = f.readlines()
+                    stat = entry.stat()
+                    if stat.st_mtime >= cutoff_ts:
+                        log_files.append((entry.path, stat))
             
-            # 保存导出的日志
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_content, f, ensure_ascii=False, indent=2)
+            # 按原始字节流式写入压缩包，不在内存中拆分行
+            index = {}
+            with zipfile.ZipFile(export_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for log_file, stat in log_files:
+                    filename = os.path.basename(log_file)
+                    info = zipfile.ZipInfo(filename, date_time=time.localtime(stat.st_mtime)[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(log_file, 'rb') as src, zf.open(info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, _EXPORT_COPY_BUFFER_SIZE)
+                    
+                    index[filename] = {
+                        'size': stat.st_size,
+                        'modified': datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
+                    }
+                
+                zf.writestr('index.json', json.dumps(index, ensure_ascii=False))
             
             self.info(f"Logs exported successfully to {export_path}", extra={'export_path': export_path, 'days': days})
             
@@ -384,9 +655,13 @@ class LogManager:
             Dict: 轮转结果
         """
         try:
-            for handler in self.logger.handlers:
-                if isinstance(handler, logging.handlers.RotatingFileHandler):
+            # 先写出已入队的记录，保证它们落在轮转前的文件中
+            self._listener.stop()
+            try:
+                for handler in self._file_handlers:
                     handler.doRollover()
+            finally:
+                self._listener.start()
             
             self.info("Logs rotated successfully")
             
@@ -418,24 +693,27 @@ class LogManager:
             os.makedirs(archive_dir, exist_ok=True)
             
             # 获取时间范围
-            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days)
+            cutoff_ts = (datetime.datetime.now() - datetime.timedelta(days=days)).timestamp()
             
             # 查找并归档旧日志
             archived_files = []
-            for filename in os.listdir(self.log_dir):
-                if filename.startswith(self.name) and (filename.endswith('.log') or filename.endswith('.log.')):
-                    file_path = os.path.join(self.log_dir, filename)
-                    file_modified = datetime.datetime.fromtimestamp(os.path.getmtime(file_path))
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not (filename.startswith(self.name) and (filename.endswith('.log') or filename.endswith('.log.'))):
+                        continue
                     
                     # 只归档指定天数前的日志
-                    if file_modified < cutoff_date:
+                    mtime = entry.stat().st_mtime
+                    if mtime < cutoff_ts:
                         # 创建归档文件名（添加日期前缀）
-                        date_prefix = file_modified.strftime('%Y%m%d')
+                        tm = time.localtime(mtime)
+                        date_prefix = f"{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}"
                         archive_filename = f"{date_prefix}_{filename}"
                         archive_path = os.path.join(archive_dir, archive_filename)
                         
-                        # 移动文件到归档目录
-                        shutil.move(file_path, archive_path)
+                        # 归档目录与日志在同一文件系统中，直接原子重命名
+                        os.replace(entry.path, archive_path)
                         archived_files.append(archive_filename)
             
             self.info(f"Archived {len(archived_files)} old log files", extra={'archived_count': len(archived_files), 'days': days})
@@ -466,11 +744,17 @@ class LogManager:
         # 更新日志器级别
         self.logger.setLevel(new_level)
         
+        # 先让监听线程处理完已入队的记录，避免它们按新级别过滤
+        self._listener.stop()
+        
         # 更新所有处理器级别
-        for handler in self.logger.handlers:
+        for handler in self.logger.handlers + list(self._file_handlers):
             handler.setLevel(new_level)
         
+        self._listener.start()
+        
         self.log_level = new_level
+        self._refresh_level_cache()
         self.info(f"Log level changed to {level}", extra={'new_level': level})
     
     def get_logger(self) -> logging.Logger:
@@ -483,13 +767,14 @@ class LogManager:
         return self.logger
 
 
-# 全局日志管理器实例
-_global_log_manager = None
+# 按名称缓存的日志管理器实例
+_log_managers: Dict[str, LogManager] = {}
+_log_managers_lock = threading.Lock()
 
 
 def get_logger(name: str = 'seo_auto_optimizer') -> LogManager:
     """
-    获取全局日志管理器实例
+    获取指定名称的日志管理器实例，同一名称只创建一次
     
     Args:
         name: 日志名称
@@ -497,9 +782,13 @@ def get_logger(name: str = 'seo_auto_optimizer') -> LogManager:
     Returns:
         LogManager: 日志管理器实例
     """
-    global _global_log_manager
-    
-    if _global_log_manager is None:
-        _global_log_manager = LogManager(name)
+    log_manager = _log_managers.get(name)
+    if log_manager is None:
+        # 双重检查，避免多个线程同时首次调用时重复创建并重置处理器
+        with _log_managers_lock:
+            log_manager = _log_managers.get(name)
+            if log_manager is None:
+                log_manager = LogManager(name)
+                _log_managers[name] = log_manager
     
-    return _global_log_manager
\ No newline at end of file
+    return log_manager
@@ -27,6 +27,8 @@ class OptimizeExecutor:
         # 获取配置项
         self.optimization_config = config_manager.get_config('optimization_config') or {}
         self.file_types = config_manager.get_config('file_types') or {}
+        # HTML扩展名集合，逐页检查文件类型时为O(1)查找
+        self._html_exts = config_manager.get_file_type_sets()[0].get('html', frozenset(('.html', '.htm')))
         self.exclude_patterns = config_manager.get_config('exclude_patterns') or []
         
         # 优化操作的历史记录
@@ -205,8 +207,7 @@ class OptimizeExecutor:
         
         # 检查文件类型
         file_ext = os.path.splitext(full_path)[1].lower()
-        html_exts = self.file_types.get('html', ['.html', '.htm'])
-        if file_ext not in html_exts:
+        if file_ext not in self._html_exts:
             logger.warning(f"不支持的文件类型: {full_path}")
             return stats
         
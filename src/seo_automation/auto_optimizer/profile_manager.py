@@ -325,17 +325,14 @@ class ProfileManager:
             # 验证配置文件
             self._validate_profile(profile_content)
             
-            # 更新当前配置文件
-            self.current_profile = profile_name
-            
-            # 更新配置管理器
-            self._update_config_manager(profile_content)
+            self.apply_profile(profile_name, profile_content)
             
             logger.info(f"配置文件加载成功: {profile_name}")
             
             return {
                 'status': 'success',
                 'profile_name': profile_name,
+                'profile_path': profile_path,
                 'profile_content': profile_content
             }
             
@@ -346,6 +343,20 @@ class ProfileManager:
                 'error': str(e)
             }
     
+    def apply_profile(self, profile_name: str, profile_content: Dict[str, Any]):
+        """
+        将已加载的配置文件设为当前配置文件，并同步到配置管理器
+        
+        Args:
+            profile_name: 配置文件名称
+            profile_content: 配置内容
+        """
+        # 更新当前配置文件
+        self.current_profile = profile_name
+        
+        # 更新配置管理器
+        self._update_config_manager(profile_content)
+    
     def save_profile(self, profile_content: Dict[str, Any]) -> Dict[str, Any]:
         """
         保存配置文件
@@ -449,31 +460,43 @@ class ProfileManager:
         for file in os.listdir(self.profiles_dir):
             if file.endswith('.json'):
                 profile_name = file[:-5]  # 移除.json扩展名
-                
-                try:
-                    # 读取配置文件信息
-                    profile_content = self._load_profile_content(profile_name)
-                    
-                    # 收集基本信息
-                    profile_info = {
-                        'profile_name': profile_name,
-                        'description': profile_content.get('description', ''),
-                        'site_path': profile_content.get('site_path', ''),
-                        'created_at': profile_content.get('created_at', ''),
-                        'updated_at': profile_content.get('updated_at', ''),
-                        'optimization_level': profile_content.get('optimization_config', {}).get('optimization_level', 'moderate'),
-                        'file_path': self._get_profile_path(profile_name)
-                    }
-                    
+                profile_info = self.get_profile_info(profile_name)
+                if profile_info is not None:
                     profiles.append(profile_info)
-                except Exception as e:
-                    logger.error(f"读取配置文件信息失败 {profile_name}: {str(e)}")
         
         # 按更新时间排序
         profiles.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
         
         return profiles
     
+    def get_profile_info(self, profile_name: str) -> Optional[Dict[str, Any]]:
+        """
+        获取配置文件的基本信息
+        
+        Args:
+            profile_name: 配置文件名称
+            
+        Returns:
+            Dict: 配置文件基本信息，读取失败则返回None
+        """
+        try:
+            # 读取配置文件信息
+            profile_content = self._load_profile_content(profile_name)
+            
+            # 收集基本信息
+            return {
+                'profile_name': profile_name,
+                'description': profile_content.get('description', ''),
+                'site_path': profile_content.get('site_path', ''),
+                'created_at': profile_content.get('created_at', ''),
+                'updated_at': profile_content.get('updated_at', ''),
+                'optimization_level': profile_content.get('optimization_config', {}).get('optimization_level', 'moderate'),
+                'file_path': self._get_profile_path(profile_name)
+            }
+        except Exception as e:
+            logger.error(f"读取配置文件信息失败 {profile_name}: {str(e)}")
+            return None
+    
     def get_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
         """
         获取配置文件内容
@@ -0,0 +1,210 @@
+import os
+import time
+import shutil
+import zipfile
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.seo_automation.auto_optimizer.config_manager import ConfigManager
+from src.seo_automation.auto_optimizer import backup_manager as backup_module
+from src.seo_automation.auto_optimizer.backup_manager import BackupManager
+
+
+class TestBackupManager(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.site_path = os.path.join(self.temp_dir, 'site')
+        self.backup_dir = os.path.join(self.temp_dir, 'backups')
+
+        # 测试站点
+        self.files = {
+            'index.html': '<html><body>' + '首页内容' * 500 + '</body></html>',
+            'about.htm': '<html>关于我们</html>',
+            'css/style.css': 'body { margin: 0; }' * 50,
+            'js/app.js': 'console.log("app");',
+            'sub/deep/page.html': '<p>深层页面</p>' * 200,
+        }
+        for rel_path, content in self.files.items():
+            self._write_site_file(rel_path, content)
+
+        config_manager = ConfigManager()
+        config_manager.set_config('site_path', self.site_path)
+        config_manager.set_config('backup_config', {'backup_directory': self.backup_dir, 'keep_backups': 5})
+        config_manager.set_config('file_types', {
+            'html': ['.html', '.htm'],
+            'css': ['.css'],
+            'javascript': ['.js'],
+        })
+        config_manager.set_config('exclude_patterns', [])
+        self.backup_manager = BackupManager(config_manager)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_site_file(self, rel_path, content):
+        path = os.path.join(self.site_path, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def _read_site_file(self, rel_path):
+        with open(os.path.join(self.site_path, rel_path), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _create_backup(self, description, backup_manager=None):
+        # 备份ID精确到秒，连续创建时等待进入下一秒
+        time.sleep(1.1)
+        result = (backup_manager or self.backup_manager).create_backup(description)
+        self.assertEqual(result['status'], 'success')
+        return result['backup_info']
+
+    def test_incremental_backup_reuse_and_restore(self):
+        """测试增量备份复用未变化的条目，并能正确恢复"""
+        full_info = self._create_backup('full')
+        backup_count = full_info['stats']['backup_files']
+        self.assertGreater(backup_count, 0)
+        self.assertEqual(full_info['stats']['reused_files'], 0)
+        self.assertIsNone(full_info['incremental_base_id'])
+
+        # 文件未变化时，所有条目都从上一次备份复用
+        unchanged_info = self._create_backup('unchanged')
+        self.assertEqual(unchanged_info['incremental_base_id'], full_info['backup_id'])
+        self.assertEqual(unchanged_info['stats']['reused_files'], backup_count)
+        self.assertEqual(unchanged_info['stats']['error_files'], 0)
+        with zipfile.ZipFile(unchanged_info['backup_path']) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(len(zipf.namelist()), backup_count)
+
+        # 修改一个文件后，只有该文件重新压缩
+        self._write_site_file('index.html', '<html>修改后的首页</html>')
+        changed_info = self._create_backup('changed')
+        self.assertEqual(changed_info['stats']['reused_files'], backup_count - 1)
+        with zipfile.ZipFile(changed_info['backup_path']) as zipf:
+            self.assertIsNone(zipf.testzip())
+
+        # 从复用条目生成的备份恢复，内容与原始文件一致
+        self._write_site_file('css/style.css', 'broken')
+        result = self.backup_manager.restore_from_backup(unchanged_info['backup_id'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['restore_info']['stats']['error_files'], 0)
+        for rel_path, content in self.files.items():
+            self.assertEqual(self._read_site_file(rel_path), content)
+
+        # 从修改后的备份恢复，得到修改后的内容
+        result = self.backup_manager.restore_from_backup(changed_info['backup_id'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(self._read_site_file('index.html'), '<html>修改后的首页</html>')
+        self.assertEqual(self._read_site_file('sub/deep/page.html'), self.files['sub/deep/page.html'])
+
+    def test_raw_zip_internals_available(self):
+        """测试当前Python的zipfile内部接口探测通过，预压缩写入路径被实际使用"""
+        self.assertTrue(backup_module._RAW_ZIP_WRITE_SUPPORTED)
+
+    def test_backup_without_raw_zip_write(self):
+        """测试zipfile内部接口不可用时退回公开接口完成备份和恢复"""
+        with patch.object(backup_module, '_RAW_ZIP_WRITE_SUPPORTED', False):
+            self._create_backup('full')
+            info = self._create_backup('fallback')
+        self.assertEqual(info['stats']['reused_files'], 0)
+        self.assertEqual(info['stats']['error_files'], 0)
+        with zipfile.ZipFile(info['backup_path']) as zipf:
+            self.assertIsNone(zipf.testzip())
+
+        self._write_site_file('index.html', 'changed')
+        result = self.backup_manager.restore_from_backup(info['backup_id'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(self._read_site_file('index.html'), self.files['index.html'])
+
+    def test_restore_without_member_reader(self):
+        """测试zipfile内部接口不可用时退回ZipFile.open完成恢复"""
+        self.assertTrue(backup_module._MEMBER_READER_SUPPORTED)
+        info = self._create_backup('reader')
+        self._write_site_file('index.html', 'changed')
+        self._write_site_file('sub/deep/page.html', 'changed')
+
+        with patch.object(backup_module, '_MEMBER_READER_SUPPORTED', False):
+            result = self.backup_manager.restore_from_backup(info['backup_id'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['restore_info']['stats']['error_files'], 0)
+        for rel_path, content in self.files.items():
+            self.assertEqual(self._read_site_file(rel_path), content)
+
+    def test_index_shared_between_instances(self):
+        """测试多个实例交替创建备份时索引不会丢失其他实例的备份"""
+        other_manager = BackupManager(self.backup_manager.config_manager)
+        self.assertEqual(self.backup_manager.list_backups(), [])
+
+        other_info = self._create_backup('other', other_manager)
+        own_info = self._create_backup('own')
+
+        backup_ids = [b['backup_id'] for b in other_manager.list_backups()]
+        self.assertEqual(backup_ids, [own_info['backup_id'], other_info['backup_id']])
+        self.assertEqual(other_manager.get_latest_backup_info()['backup_id'], own_info['backup_id'])
+
+    def test_partial_restore(self):
+        """测试只恢复指定的文件"""
+        info = self._create_backup('partial')
+        self._write_site_file('index.html', 'changed')
+        self._write_site_file('css/style.css', 'changed')
+
+        result = self.backup_manager.restore_from_backup(info['backup_id'], paths=['index.html'])
+        self.assertEqual(result['status'], 'success')
+        stats = result['restore_info']['stats']
+        self.assertEqual(stats['restored_files'], 1)
+        self.assertEqual(stats['error_files'], 0)
+        self.assertEqual(self._read_site_file('index.html'), self.files['index.html'])
+        self.assertEqual(self._read_site_file('css/style.css'), 'changed')
+
+    def test_partial_restore_missing_path(self):
+        """测试恢复备份中不存在的文件时计入错误数"""
+        info = self._create_backup('missing')
+
+        result = self.backup_manager.restore_from_backup(info['backup_id'], paths=['js/app.js', 'not/exist.html'])
+        self.assertEqual(result['status'], 'success')
+        stats = result['restore_info']['stats']
+        self.assertEqual(stats['total_files'], 2)
+        self.assertEqual(stats['restored_files'], 1)
+        self.assertEqual(stats['error_files'], 1)
+
+    def test_restore_corrupted_member(self):
+        """测试条目损坏时只影响该条目，目标文件保持原样且不残留临时文件"""
+        info = self._create_backup('corrupted')
+        with zipfile.ZipFile(info['backup_path'], 'a') as zipf:
+            zipf.writestr('stored.html', 'UNIQUE-CONTENT' * 10, compress_type=zipfile.ZIP_STORED)
+        with open(info['backup_path'], 'rb') as f:
+            data = f.read()
+        with open(info['backup_path'], 'wb') as f:
+            f.write(data.replace(b'UNIQUE-CONTENT', b'UNIQUE-CONTENX', 1))
+        self._write_site_file('stored.html', 'original')
+        self._write_site_file('index.html', 'changed')
+
+        # 部分恢复只读取选中的条目，其他条目损坏不影响
+        result = self.backup_manager.restore_from_backup(info['backup_id'], paths=['index.html'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['restore_info']['stats']['error_files'], 0)
+        self.assertEqual(self._read_site_file('index.html'), self.files['index.html'])
+
+        # 损坏的条目计入错误数，原文件不被覆盖
+        result = self.backup_manager.restore_from_backup(info['backup_id'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['restore_info']['stats']['error_files'], 1)
+        self.assertEqual(self._read_site_file('stored.html'), 'original')
+        self.assertEqual([name for name in os.listdir(self.site_path) if name.endswith('.tmp')], [])
+
+    def test_restore_member_path_stays_in_site(self):
+        """测试包含'..'的条目名恢复到网站目录内"""
+        info = self._create_backup('traversal')
+        with zipfile.ZipFile(info['backup_path'], 'a') as zipf:
+            zipf.writestr('../escape.html', 'escaped')
+
+        result = self.backup_manager.restore_from_backup(info['backup_id'], paths=['../escape.html'])
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['restore_info']['stats']['restored_files'], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, 'escape.html')))
+        self.assertEqual(self._read_site_file('escape.html'), 'escaped')
+
+
+if __name__ == '__main__':
+    unittest.main()